@@ -3,7 +3,10 @@ Dependency injection for FastAPI endpoints.
 Provides singleton instances and factory functions for services.
 """
 from functools import lru_cache
+from typing import Any, Dict
+
 from app.core.config import Settings, get_settings
+from app.core.logging import get_request_id
 
 
 @lru_cache()
@@ -17,6 +20,19 @@ def get_app_settings() -> Settings:
     return get_settings()
 
 
+async def get_request_context() -> Dict[str, Any]:
+    """
+    Build the per-request logging context once.
+
+    Handlers spread this into their log ``context`` dicts instead of
+    re-reading the request-id contextvar at every log call.
+
+    Returns:
+        Dictionary with the current request_id
+    """
+    return {"request_id": get_request_id()}
+
+
 # Cleanup function for application shutdown
 def cleanup_resources():
     """Clean up resources on application shutdown."""
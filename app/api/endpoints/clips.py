@@ -2,18 +2,20 @@
 Clip extraction and availability API endpoints.
 Handles video clip extraction for moments and clip serving via GCS signed URLs.
 """
+import asyncio
 import logging
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-import time
 
 logger = logging.getLogger(__name__)
 
 from app.models.schemas import VideoAvailabilityResponse
 from app.database.dependencies import get_db
+from app.api.deps import get_request_context
 from app.services.moments_service import get_moment_by_id
+from app.services.pipeline.upload_service import get_uploader
 from app.services.video_clipping_service import (
     get_clip_duration,
 )
@@ -24,8 +26,7 @@ from app.utils.timestamp import calculate_padded_boundaries, extract_words_in_ra
 from app.core.logging import (
     log_operation_start,
     log_operation_complete,
-    log_operation_error,
-    get_request_id
+    log_operation_error
 )
 
 router = APIRouter()
@@ -36,12 +37,12 @@ async def check_video_availability(
     video_id: str,
     moment_id: str,
     db: AsyncSession = Depends(get_db),
+    ctx: dict = Depends(get_request_context),
 ):
     """
     Check if a video clip is available for a moment and validate alignment with transcript.
     Clip existence is determined by querying the database.
     """
-    start_time = time.time()
     operation = "check_video_availability"
 
     log_operation_start(
@@ -49,11 +50,11 @@ async def check_video_availability(
         function="check_video_availability",
         operation=operation,
         message=f"Checking video availability for {video_id}/{moment_id}",
-        context={"video_id": video_id, "moment_id": moment_id, "request_id": get_request_id()},
+        context={"video_id": video_id, "moment_id": moment_id, **ctx},
     )
 
     try:
-        video = await video_db_repository.get_by_identifier(db, video_id)
+        video = await video_db_repository.get_snapshot_by_identifier(db, video_id)
         if not video:
             raise HTTPException(status_code=404, detail="Video not found")
 
@@ -80,13 +81,12 @@ async def check_video_availability(
             return result
 
         # Generate fresh signed URL from clip's stored cloud_url
-        from app.services.pipeline.upload_service import GCSUploader
-        uploader = GCSUploader()
-        clip_url = uploader.generate_signed_url(clip.cloud_url)
+        uploader = get_uploader()
+        clip_url = await uploader.generate_signed_url_async(clip.cloud_url)
         result.clip_url = clip_url
 
-        # Try to get clip duration (checks temp directory)
-        clip_duration = get_clip_duration(moment_id, f"{video_id}.mp4")
+        # Try to get clip duration (checks temp directory; file I/O off the event loop)
+        clip_duration = await asyncio.to_thread(get_clip_duration, moment_id, f"{video_id}.mp4")
         if clip_duration is None or clip_duration <= 0:
             # Mark as available even if we can't determine duration
             result.available = True
@@ -147,7 +147,6 @@ async def check_video_availability(
             result.warning = f"Could not validate alignment: {str(e)}"
             result.available = True
 
-        duration = time.time() - start_time
         log_operation_complete(
             logger="app.api.endpoints.clips",
             function="check_video_availability",
@@ -158,7 +157,6 @@ async def check_video_availability(
                 "moment_id": moment_id,
                 "available": result.available,
                 "duration_match": result.duration_match,
-                "duration_seconds": duration,
             },
         )
 
@@ -167,14 +165,13 @@ async def check_video_availability(
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
             logger="app.api.endpoints.clips",
             function="check_video_availability",
             operation=operation,
             error=e,
             message="Error checking video availability",
-            context={"video_id": video_id, "moment_id": moment_id, "duration_seconds": duration},
+            context={"video_id": video_id, "moment_id": moment_id},
         )
         raise
 
@@ -194,9 +191,8 @@ async def stream_clip(
     if not clip:
         raise HTTPException(status_code=404, detail=f"Clip not found for moment '{moment_identifier}'")
 
-    from app.services.pipeline.upload_service import GCSUploader
-    uploader = GCSUploader()
-    signed_url = uploader.generate_signed_url(clip.cloud_url)
+    uploader = get_uploader()
+    signed_url = await uploader.generate_signed_url_async(clip.cloud_url)
 
     return RedirectResponse(url=signed_url, status_code=302)
 
@@ -216,10 +212,8 @@ async def get_clip_url(
     if not clip:
         raise HTTPException(status_code=404, detail=f"Clip not found for moment '{moment_identifier}'")
 
-    from app.services.pipeline.upload_service import GCSUploader
-
-    uploader = GCSUploader()
-    signed_url = uploader.generate_signed_url(clip.cloud_url)
+    uploader = get_uploader()
+    signed_url = await uploader.generate_signed_url_async(clip.cloud_url)
 
     # Expiry comes from the uploader's configured value (set from settings)
     expires_in_seconds = int(uploader.expiry_hours * 3600)
@@ -228,7 +222,6 @@ async def get_clip_url(
     moment = await moment_db_repository.get_by_identifier(db, moment_identifier)
     video_identifier = None
     if moment:
-        from app.repositories import video_db_repository
         video = await video_db_repository.get_by_id(db, moment.video_id)
         if video:
             video_identifier = video.identifier
@@ -319,12 +312,13 @@ async def list_clips_for_video(
     if not clips:
         return []
 
-    from app.services.pipeline.upload_service import GCSUploader
-    uploader = GCSUploader()
+    uploader = get_uploader()
+    signed_urls = await asyncio.gather(
+        *(uploader.generate_signed_url_async(clip.cloud_url) for clip in clips)
+    )
 
     result = []
-    for clip in clips:
-        signed_url = uploader.generate_signed_url(clip.cloud_url)
+    for clip, signed_url in zip(clips, signed_urls):
 
         # Get moment identifier from the relationship
         moment_identifier = None
@@ -3,17 +3,17 @@ Video deletion API endpoint.
 Handles scoped deletion of videos and associated resources.
 """
 import logging
-import time
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Depends
 
 from app.services.video_delete_service import VideoDeleteService
+from app.services.video_response_cache import invalidate_video_responses
+from app.api.deps import get_request_context
 from app.core.logging import (
     log_operation_start,
     log_operation_complete,
-    log_operation_error,
-    get_request_id
+    log_operation_error
 )
 
 router = APIRouter()
@@ -31,6 +31,7 @@ async def delete_video(
         description="Comma-separated moment identifiers. Only used when scope=moments.",
     ),
     force: bool = Query(False, description="Skip active pipeline check"),
+    ctx: dict = Depends(get_request_context),
 ):
     """
     Delete a video or a subset of its associated resources.
@@ -56,7 +57,6 @@ async def delete_video(
     if scope == "moments" and moment_ids:
         parsed_moment_ids = [m.strip() for m in moment_ids.split(",") if m.strip()]
 
-    start_time = time.time()
     operation = "delete_video"
 
     log_operation_start(
@@ -69,7 +69,7 @@ async def delete_video(
             "scope": scope,
             "moment_ids": parsed_moment_ids,
             "force": force,
-            "request_id": get_request_id(),
+            **ctx,
         },
     )
 
@@ -83,7 +83,6 @@ async def delete_video(
         )
 
         if result.status == "failed":
-            duration = time.time() - start_time
             log_operation_error(
                 logger="app.api.endpoints.delete",
                 function="delete_video",
@@ -94,7 +93,6 @@ async def delete_video(
                     "video_id": video_id,
                     "scope": scope,
                     "errors": result.errors,
-                    "duration_seconds": duration,
                 },
             )
             raise HTTPException(
@@ -106,7 +104,8 @@ async def delete_video(
                 },
             )
 
-        duration = time.time() - start_time
+        await invalidate_video_responses(video_id)
+
         log_operation_complete(
             logger="app.api.endpoints.delete",
             function="delete_video",
@@ -118,7 +117,6 @@ async def delete_video(
                 "status": result.status,
                 "deleted": result.deleted,
                 "errors": result.errors,
-                "duration_seconds": duration,
             },
         )
 
@@ -133,7 +131,6 @@ async def delete_video(
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
             logger="app.api.endpoints.delete",
             function="delete_video",
@@ -143,7 +140,6 @@ async def delete_video(
             context={
                 "video_id": video_id,
                 "scope": scope,
-                "duration_seconds": duration,
             },
         )
         raise HTTPException(
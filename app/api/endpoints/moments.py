@@ -3,46 +3,48 @@ Moment-related API endpoints.
 Handles moment CRUD operations.
 """
 from fastapi import APIRouter, HTTPException, Depends
-import time
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.dependencies import get_db
+from app.api.deps import get_request_context
 from app.repositories import video_db_repository
 from app.models.schemas import MomentResponse
 from app.services.moments_service import load_moments, add_moment
 from app.core.logging import (
     log_event,
+    log_event_lazy,
     log_operation_start,
     log_operation_complete,
-    log_operation_error,
-    get_request_id
+    log_operation_error
 )
 
 router = APIRouter()
 
+_LOGGER = "app.api.endpoints.moments"
+
 
 @router.get("/videos/{video_id}/moments", response_model=list[MomentResponse])
-async def get_moments(video_id: str, db: AsyncSession = Depends(get_db)):
+async def get_moments(video_id: str, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """Get all moments for a video."""
-    start_time = time.time()
     operation = "get_moments"
 
-    log_event(
+    log_event_lazy(
         level="DEBUG",
-        logger="app.api.endpoints.moments",
+        logger=_LOGGER,
         function="get_moments",
         operation=operation,
         event="operation_start",
-        message=f"Getting moments for {video_id}",
-        context={"video_id": video_id, "request_id": get_request_id()}
+        message="Getting moments for %s",
+        args=(video_id,),
+        context_factory=lambda: {"video_id": video_id, **ctx}
     )
 
     try:
-        video = await video_db_repository.get_by_identifier(db, video_id)
+        video = await video_db_repository.get_snapshot_by_identifier(db, video_id)
         if not video:
             log_event(
                 level="WARNING",
-                logger="app.api.endpoints.moments",
+                logger=_LOGGER,
                 function="get_moments",
                 operation=operation,
                 event="validation_error",
@@ -53,18 +55,16 @@ async def get_moments(video_id: str, db: AsyncSession = Depends(get_db)):
 
         moments = await load_moments(f"{video_id}.mp4")
 
-        duration = time.time() - start_time
-        log_event(
+        log_event_lazy(
             level="DEBUG",
-            logger="app.api.endpoints.moments",
+            logger=_LOGGER,
             function="get_moments",
             operation=operation,
             event="operation_complete",
             message="Successfully retrieved moments",
-            context={
+            context_factory=lambda: {
                 "video_id": video_id,
-                "moment_count": len(moments),
-                "duration_seconds": duration
+                "moment_count": len(moments)
             }
         )
 
@@ -73,26 +73,24 @@ async def get_moments(video_id: str, db: AsyncSession = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.moments",
+            logger=_LOGGER,
             function="get_moments",
             operation=operation,
             error=e,
             message="Error getting moments",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
         raise
 
 
 @router.post("/videos/{video_id}/moments", response_model=MomentResponse, status_code=201)
-async def create_moment(video_id: str, moment: MomentResponse, db: AsyncSession = Depends(get_db)):
+async def create_moment(video_id: str, moment: MomentResponse, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """Add a new moment to a video."""
-    start_time = time.time()
     operation = "create_moment"
 
     log_operation_start(
-        logger="app.api.endpoints.moments",
+        logger=_LOGGER,
         function="create_moment",
         operation=operation,
         message=f"Creating moment for {video_id}",
@@ -103,11 +101,12 @@ async def create_moment(video_id: str, moment: MomentResponse, db: AsyncSession
                 "end_time": moment.end_time,
                 "title": moment.title
             },
-            "request_id": get_request_id()
+            **ctx
         }
     )
 
     try:
+        # Current row, not the cached snapshot: the duration is written by the worker
         video = await video_db_repository.get_by_identifier(db, video_id)
         if not video:
             raise HTTPException(status_code=404, detail="Video not found")
@@ -129,16 +128,14 @@ async def create_moment(video_id: str, moment: MomentResponse, db: AsyncSession
         if not success:
             raise HTTPException(status_code=400, detail=error_message)
 
-        duration = time.time() - start_time
         log_operation_complete(
-            logger="app.api.endpoints.moments",
+            logger=_LOGGER,
             function="create_moment",
             operation=operation,
             message="Successfully created moment",
             context={
                 "video_id": video_id,
-                "moment_id": created_moment.get("id"),
-                "duration_seconds": duration
+                "moment_id": created_moment.get("id")
             }
         )
 
@@ -147,13 +144,12 @@ async def create_moment(video_id: str, moment: MomentResponse, db: AsyncSession
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.moments",
+            logger=_LOGGER,
             function="create_moment",
             operation=operation,
             error=e,
             message="Error creating moment",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
         raise
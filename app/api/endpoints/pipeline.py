@@ -29,6 +29,7 @@ from app.repositories import video_db_repository
 from app.services.pipeline.status import initialize_status, get_active_status
 from app.services.pipeline.lock import is_locked, set_cancellation_flag
 from app.services.pipeline.redis_history import get_latest_run
+from app.services.video_response_cache import invalidate_video_responses
 from app.services.moments_service import load_moments
 from app.utils.url import generate_video_id_from_url
 
@@ -434,6 +435,7 @@ async def start_pipeline(
                 title=placeholder_title,
             )
             await db.commit()
+            await invalidate_video_responses(video_id)
             logger.info(f"Created placeholder video record for {video_id}")
         except Exception as e:
             await db.rollback()
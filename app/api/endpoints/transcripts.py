@@ -2,77 +2,60 @@
 Transcript-related API endpoints.
 """
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-import time
 
 from app.database.dependencies import get_db
+from app.api.deps import get_request_context
 from app.repositories import video_db_repository
 from app.services.transcript_service import load_transcript
-from app.core.logging import (
-    log_event,
-    log_operation_error,
-    get_request_id
-)
+from app.core.logging import log_event_lazy
 
 router = APIRouter()
 
+# Static logging metadata, built once at import instead of per request
+_LOG_META_GET_TRANSCRIPT = {
+    "logger": "app.api.endpoints.transcripts",
+    "function": "get_transcript",
+    "operation": "get_transcript",
+}
 
-@router.get("/videos/{video_id}/transcript")
-async def get_transcript(video_id: str, db: AsyncSession = Depends(get_db)):
+
+@router.get("/videos/{video_id}/transcript", response_class=ORJSONResponse)
+async def get_transcript(video_id: str, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """Get transcript for a video."""
-    start_time = time.time()
-    operation = "get_transcript"
 
-    log_event(
+    log_event_lazy(
         level="DEBUG",
-        logger="app.api.endpoints.transcripts",
-        function="get_transcript",
-        operation=operation,
+        **_LOG_META_GET_TRANSCRIPT,
         event="operation_start",
-        message=f"Getting transcript for {video_id}",
-        context={"video_id": video_id, "request_id": get_request_id()}
+        message="Getting transcript for %s",
+        args=(video_id,),
+        context_factory=lambda: {"video_id": video_id, **ctx}
     )
 
-    try:
-        # Validate video exists in database
-        video = await video_db_repository.get_by_identifier(db, video_id)
-        if not video:
-            raise HTTPException(status_code=404, detail="Video not found")
-
-        # Load transcript from database
-        audio_filename = f"{video_id}.wav"
-        transcript_data = await load_transcript(audio_filename)
+    # Validate video exists in database
+    video = await video_db_repository.get_snapshot_by_identifier(db, video_id)
+    if not video:
+        raise HTTPException(status_code=404, detail="Video not found")
 
-        if transcript_data is None:
-            raise HTTPException(status_code=404, detail="Transcript not found for this video")
+    # Load transcript from database
+    audio_filename = f"{video_id}.wav"
+    transcript_data = await load_transcript(audio_filename)
 
-        duration = time.time() - start_time
-        log_event(
-            level="DEBUG",
-            logger="app.api.endpoints.transcripts",
-            function="get_transcript",
-            operation=operation,
-            event="operation_complete",
-            message="Successfully retrieved transcript",
-            context={
-                "video_id": video_id,
-                "has_segments": "segment_timestamps" in transcript_data if transcript_data else False,
-                "duration_seconds": duration
-            }
-        )
+    if transcript_data is None:
+        raise HTTPException(status_code=404, detail="Transcript not found for this video")
 
-        return transcript_data
+    log_event_lazy(
+        level="DEBUG",
+        **_LOG_META_GET_TRANSCRIPT,
+        event="operation_complete",
+        message="Successfully retrieved transcript",
+        context_factory=lambda: {
+            "video_id": video_id,
+            "has_segments": "segment_timestamps" in transcript_data
+        }
+    )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        duration = time.time() - start_time
-        log_operation_error(
-            logger="app.api.endpoints.transcripts",
-            function="get_transcript",
-            operation=operation,
-            error=e,
-            message="Error getting transcript",
-            context={"video_id": video_id, "duration_seconds": duration}
-        )
-        raise
+    # Serialize with orjson directly, skipping jsonable_encoder on large word lists
+    return ORJSONResponse(transcript_data)
@@ -2,131 +2,229 @@
 Video-related API endpoints.
 Handles video listing, retrieval, streaming, and thumbnails.
 """
-from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import RedirectResponse
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
+import asyncio
+import hashlib
 import time
+from functools import lru_cache, partial
+from typing import Dict, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.schemas import VideoResponse
-from app.services.thumbnail_service import get_thumbnail_url_async, generate_thumbnail_async
-from app.services.audio_service import check_audio_exists
+from app.services.thumbnail_service import (
+    get_thumbnail_url_async,
+    thumbnail_urls_from_rows,
+    generate_thumbnail_async,
+)
+from app.services.audio_service import check_audio_exists, get_identifiers_with_audio
+from app.services.pipeline.concurrency import GlobalConcurrencyLimits
+from app.services.pipeline.upload_service import get_uploader
 from app.services.transcript_service import check_transcript_exists
+from app.services.video_response_cache import (
+    LIST_KEY,
+    video_key,
+    get_cached_response,
+    set_cached_response,
+)
+from app.core.config import get_settings
 from app.database.dependencies import get_db
+from app.database.session import get_session_factory
+from app.api.deps import get_request_context
 from app.repositories import video_db_repository, thumbnail_db_repository
 from app.core.logging import (
     log_event,
-    log_operation_start,
+    log_event_lazy,
     log_operation_complete,
-    log_operation_error,
-    get_request_id
+    log_operation_error
 )
 
 router = APIRouter()
 
+_LOGGER = "app.api.endpoints.videos"
+
+
+_TITLE_SEPARATORS = str.maketrans("-_", "  ")
+
+
+@lru_cache(maxsize=1)
+def _signed_url_expires_in() -> int:
+    """Signed URL lifetime in seconds, as reported by the URL endpoints (settings are process-static)."""
+    return int(get_settings().gcs_signed_url_expiry_hours * 3600)
+
 
-@router.get("/videos", response_model=list[VideoResponse])
-async def list_videos(db: AsyncSession = Depends(get_db)):
+@lru_cache(maxsize=4096)
+def _default_title(identifier: str) -> str:
+    """Human-readable fallback title derived from a video identifier."""
+    return identifier.translate(_TITLE_SEPARATORS).title()
+
+
+def _video_payload(video, thumb_data, has_audio: bool, has_transcript: bool) -> dict:
+    """
+    Build the VideoResponse-shaped dict for a DB video row/snapshot and its probe results.
+
+    Every value comes from typed DB columns or our own probes, so the payload
+    is built as a plain dict and handed straight to orjson; VideoResponse
+    stays on the routes for the OpenAPI schema only.
+    """
+    return {
+        "id": video.identifier,
+        "filename": f"{video.identifier}.mp4",
+        "title": video.title or _default_title(video.identifier),
+        "thumbnail_url": thumb_data["thumbnail_url"] if thumb_data else None,
+        "thumbnail_signed_url": thumb_data["thumbnail_signed_url"] if thumb_data else None,
+        "thumbnail_url_expires_at": thumb_data["thumbnail_url_expires_at"] if thumb_data else None,
+        "has_audio": has_audio,
+        "has_transcript": has_transcript,
+        "duration_seconds": video.duration_seconds,
+        "cloud_url": video.cloud_url,
+        "source_url": video.source_url,
+        # orjson writes datetimes natively in the same ISO 8601 form as isoformat()
+        "created_at": video.created_at,
+    }
+
+
+def _json_response(request: Request, body) -> Response:
+    """
+    Send a pre-encoded JSON body with a content-hash ETag.
+
+    Clients that send a matching If-None-Match (browsers revalidating, the
+    UI polling the list) get an empty 304 instead of the full payload.
+    """
+    if isinstance(body, str):
+        body = body.encode()
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match == "*" or etag in (t.strip() for t in if_none_match.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    # no-cache: clients may store the body but must revalidate before reuse
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+
+@router.get("/videos", response_model=list[VideoResponse], response_class=ORJSONResponse)
+async def list_videos(request: Request, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """List all available videos from database."""
-    start_time = time.time()
     operation = "list_videos"
 
-    log_event(
+    log_event_lazy(
         level="DEBUG",
-        logger="app.api.endpoints.videos",
+        logger=_LOGGER,
         function="list_videos",
         operation=operation,
         event="operation_start",
         message="Listing all videos from database",
-        context={"request_id": get_request_id()}
+        context_factory=lambda: ctx
     )
 
     try:
-        videos_from_db = await video_db_repository.list_all(db)
+        # Cache hits are already the exact JSON body; send them without decoding
+        cached = await get_cached_response(LIST_KEY)
+        if cached is not None:
+            return _json_response(request, cached)
 
-        log_event(
+        # Videos, their thumbnail rows and transcript presence in one query
+        rows = await video_db_repository.list_all_with_thumbnails(db)
+        videos_from_db = [video for video, _, _ in rows]
+
+        log_event_lazy(
             level="DEBUG",
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="list_videos",
             operation=operation,
             event="database_query_complete",
             message="Retrieved videos from database",
-            context={"video_count": len(videos_from_db)}
+            context_factory=lambda: {"video_count": len(videos_from_db)}
         )
 
-        videos = []
-        for video in videos_from_db:
-            video_filename = f"{video.identifier}.mp4"
-
-            thumb_data = await get_thumbnail_url_async(video.identifier, db)
-
-            has_audio = check_audio_exists(video_filename)
-            audio_filename = video.identifier + ".wav"
-            has_transcript = await check_transcript_exists(audio_filename)
-
-            videos.append(VideoResponse(
-                id=video.identifier,
-                filename=video_filename,
-                title=video.title or video.identifier.replace("-", " ").replace("_", " ").title(),
-                thumbnail_url=thumb_data["thumbnail_url"] if thumb_data else None,
-                thumbnail_signed_url=thumb_data["thumbnail_signed_url"] if thumb_data else None,
-                thumbnail_url_expires_at=thumb_data["thumbnail_url_expires_at"] if thumb_data else None,
-                has_audio=has_audio,
-                has_transcript=has_transcript,
-                duration_seconds=video.duration_seconds,
-                cloud_url=video.cloud_url,
-                source_url=video.source_url,
-                created_at=video.created_at.isoformat() if video.created_at else None
-            ))
-
-        duration = time.time() - start_time
-        log_event(
+        identifiers = [video.identifier for video in videos_from_db]
+        transcribed = {video.identifier for video, _, has_transcript in rows if has_transcript}
+
+        # Audio presence comes from one scandir of temp/audio in a worker thread
+        # while thumbnail signed URLs are resolved on the session
+        thumbnails, with_audio = await asyncio.gather(
+            thumbnail_urls_from_rows(
+                {video.identifier: thumbnail for video, thumbnail, _ in rows if thumbnail is not None},
+                db,
+            ),
+            asyncio.to_thread(get_identifiers_with_audio, identifiers),
+        )
+
+        videos = [
+            _video_payload(
+                video,
+                thumbnails.get(video.identifier),
+                video.identifier in with_audio,
+                video.identifier in transcribed,
+            )
+            for video in videos_from_db
+        ]
+
+        log_event_lazy(
             level="DEBUG",
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="list_videos",
             operation=operation,
             event="operation_complete",
             message="Successfully listed videos",
-            context={"video_count": len(videos), "duration_seconds": duration}
+            context_factory=lambda: {"video_count": len(videos)}
         )
 
-        return videos
+        # Encode once: the same bytes are cached and sent, and returning a
+        # Response skips FastAPI's jsonable_encoder pass
+        body = await set_cached_response(LIST_KEY, videos)
+        return _json_response(request, body)
 
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="list_videos",
             operation=operation,
             error=e,
-            message="Error listing videos",
-            context={"duration_seconds": duration}
+            message="Error listing videos"
         )
         raise HTTPException(status_code=500, detail=f"Error listing videos: {str(e)}")
 
 
 @router.get("/videos/{video_id}", response_model=VideoResponse)
-async def get_video(video_id: str, db: AsyncSession = Depends(get_db)):
+async def get_video(
+    video_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    ctx: dict = Depends(get_request_context),
+):
     """Get metadata for a specific video from database."""
-    start_time = time.time()
     operation = "get_video"
 
-    log_operation_start(
-        logger="app.api.endpoints.videos",
+    log_event_lazy(
+        level="DEBUG",
+        logger=_LOGGER,
         function="get_video",
         operation=operation,
-        message=f"Getting video metadata for {video_id}",
-        context={"video_id": video_id, "request_id": get_request_id()}
+        event="operation_start",
+        message="Getting video metadata for %s",
+        args=(video_id,),
+        context_factory=lambda: {"video_id": video_id, **ctx}
     )
 
     try:
+        cached = await get_cached_response(video_key(video_id))
+        if cached is not None:
+            return _json_response(request, cached)
+
+        # Cache miss: build the payload from the current row, not the
+        # in-process snapshot, which can lag writes made by the worker
         video = await video_db_repository.get_by_identifier(db, video_id)
 
         if not video:
             log_event(
                 level="WARNING",
-                logger="app.api.endpoints.videos",
+                logger=_LOGGER,
                 function="get_video",
                 operation=operation,
                 event="validation_error",
@@ -136,15 +234,18 @@ async def get_video(video_id: str, db: AsyncSession = Depends(get_db)):
             raise HTTPException(status_code=404, detail="Video not found")
 
         video_filename = f"{video.identifier}.mp4"
-        thumb_data = await get_thumbnail_url_async(video.identifier, db)
-
-        has_audio = check_audio_exists(video_filename)
         audio_filename = video.identifier + ".wav"
-        has_transcript = await check_transcript_exists(audio_filename)
 
-        duration = time.time() - start_time
+        # Independent probes: thumbnail (request session), transcript (own
+        # session) and audio (local stat, off the event loop)
+        thumb_data, has_audio, has_transcript = await asyncio.gather(
+            get_thumbnail_url_async(video.identifier, db),
+            asyncio.to_thread(check_audio_exists, video_filename),
+            check_transcript_exists(audio_filename),
+        )
+
         log_operation_complete(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="get_video",
             operation=operation,
             message="Successfully retrieved video metadata",
@@ -152,43 +253,30 @@ async def get_video(video_id: str, db: AsyncSession = Depends(get_db)):
                 "video_id": video_id,
                 "filename": video_filename,
                 "has_audio": has_audio,
-                "has_transcript": has_transcript,
-                "duration_seconds": duration
+                "has_transcript": has_transcript
             }
         )
 
-        return VideoResponse(
-            id=video.identifier,
-            filename=video_filename,
-            title=video.title or video.identifier.replace("-", " ").replace("_", " ").title(),
-            thumbnail_url=thumb_data["thumbnail_url"] if thumb_data else None,
-            thumbnail_signed_url=thumb_data["thumbnail_signed_url"] if thumb_data else None,
-            thumbnail_url_expires_at=thumb_data["thumbnail_url_expires_at"] if thumb_data else None,
-            has_audio=has_audio,
-            has_transcript=has_transcript,
-            duration_seconds=video.duration_seconds,
-            cloud_url=video.cloud_url,
-            source_url=video.source_url,
-            created_at=video.created_at.isoformat() if video.created_at else None
-        )
+        payload = _video_payload(video, thumb_data, has_audio, has_transcript)
+        body = await set_cached_response(video_key(video_id), payload)
+        return _json_response(request, body)
 
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="get_video",
             operation=operation,
             error=e,
             message="Error getting video",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
         raise
 
 
 @router.get("/videos/{video_id}/stream")
-async def stream_video(video_id: str, db: AsyncSession = Depends(get_db)):
+async def stream_video(video_id: str, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """
     Redirect to GCS signed URL for video streaming.
 
@@ -196,23 +284,25 @@ async def stream_video(video_id: str, db: AsyncSession = Depends(get_db)):
     to stream the video directly from Google Cloud Storage without proxying
     through the backend. GCS handles Range requests and byte-range streaming.
     """
-    start_time = time.time()
     operation = "stream_video"
 
-    log_operation_start(
-        logger="app.api.endpoints.videos",
+    log_event_lazy(
+        level="DEBUG",
+        logger=_LOGGER,
         function="stream_video",
         operation=operation,
-        message=f"Generating signed URL for video {video_id}",
-        context={"video_id": video_id, "request_id": get_request_id()}
+        event="operation_start",
+        message="Generating signed URL for video %s",
+        args=(video_id,),
+        context_factory=lambda: {"video_id": video_id, **ctx}
     )
 
     try:
-        video = await video_db_repository.get_by_identifier(db, video_id)
+        video = await video_db_repository.get_snapshot_by_identifier(db, video_id)
         if not video:
             log_event(
                 level="WARNING",
-                logger="app.api.endpoints.videos",
+                logger=_LOGGER,
                 function="stream_video",
                 operation=operation,
                 event="validation_error",
@@ -221,14 +311,13 @@ async def stream_video(video_id: str, db: AsyncSession = Depends(get_db)):
             )
             raise HTTPException(status_code=404, detail="Video not found")
 
-        from app.services.pipeline.upload_service import GCSUploader
-        uploader = GCSUploader()
-        signed_url = uploader.get_video_signed_url(video.identifier, f"{video.identifier}.mp4")
+        uploader = get_uploader()
+        signed_url = await uploader.get_video_signed_url_async(video.identifier, f"{video.identifier}.mp4")
 
         if not signed_url:
             log_event(
                 level="ERROR",
-                logger="app.api.endpoints.videos",
+                logger=_LOGGER,
                 function="stream_video",
                 operation=operation,
                 event="gcs_error",
@@ -237,13 +326,12 @@ async def stream_video(video_id: str, db: AsyncSession = Depends(get_db)):
             )
             raise HTTPException(status_code=404, detail="Video not available in cloud storage")
 
-        duration = time.time() - start_time
         log_operation_complete(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="stream_video",
             operation=operation,
             message="Redirecting to GCS signed URL",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
 
         return RedirectResponse(url=signed_url, status_code=302)
@@ -251,45 +339,44 @@ async def stream_video(video_id: str, db: AsyncSession = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="stream_video",
             operation=operation,
             error=e,
             message="Error generating signed URL",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
         raise
 
 
 @router.get("/videos/{video_id}/url")
-async def get_video_url(video_id: str, db: AsyncSession = Depends(get_db)):
+async def get_video_url(video_id: str, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """
     Get signed URL for video streaming with expiry information.
 
     Returns JSON with the signed GCS URL and expiration time in seconds.
     Used by the frontend for URL lifecycle management.
     """
-    start_time = time.time()
     operation = "get_video_url"
 
-    log_event(
+    log_event_lazy(
         level="DEBUG",
-        logger="app.api.endpoints.videos",
+        logger=_LOGGER,
         function="get_video_url",
         operation=operation,
         event="operation_start",
-        message=f"Getting signed URL for video {video_id}",
-        context={"video_id": video_id, "request_id": get_request_id()}
+        message="Getting signed URL for video %s",
+        args=(video_id,),
+        context_factory=lambda: {"video_id": video_id, **ctx}
     )
 
     try:
-        video = await video_db_repository.get_by_identifier(db, video_id)
+        video = await video_db_repository.get_snapshot_by_identifier(db, video_id)
         if not video:
             log_event(
                 level="WARNING",
-                logger="app.api.endpoints.videos",
+                logger=_LOGGER,
                 function="get_video_url",
                 operation=operation,
                 event="validation_error",
@@ -298,16 +385,13 @@ async def get_video_url(video_id: str, db: AsyncSession = Depends(get_db)):
             )
             raise HTTPException(status_code=404, detail="Video not found")
 
-        from app.services.pipeline.upload_service import GCSUploader
-        from app.core.config import get_settings
-
-        uploader = GCSUploader()
-        signed_url = uploader.get_video_signed_url(video.identifier, f"{video.identifier}.mp4")
+        uploader = get_uploader()
+        signed_url = await uploader.get_video_signed_url_async(video.identifier, f"{video.identifier}.mp4")
 
         if not signed_url:
             log_event(
                 level="ERROR",
-                logger="app.api.endpoints.videos",
+                logger=_LOGGER,
                 function="get_video_url",
                 operation=operation,
                 event="gcs_error",
@@ -316,21 +400,18 @@ async def get_video_url(video_id: str, db: AsyncSession = Depends(get_db)):
             )
             raise HTTPException(status_code=404, detail="Video not available in cloud storage")
 
-        settings = get_settings()
-        expires_in_seconds = int(settings.gcs_signed_url_expiry_hours * 3600)
+        expires_in_seconds = _signed_url_expires_in()
 
-        duration = time.time() - start_time
-        log_event(
+        log_event_lazy(
             level="DEBUG",
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="get_video_url",
             operation=operation,
             event="operation_complete",
             message="Generated signed URL",
-            context={
+            context_factory=lambda: {
                 "video_id": video_id,
-                "expires_in_seconds": expires_in_seconds,
-                "duration_seconds": duration
+                "expires_in_seconds": expires_in_seconds
             }
         )
 
@@ -342,20 +423,160 @@ async def get_video_url(video_id: str, db: AsyncSession = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="get_video_url",
             operation=operation,
             error=e,
             message="Error generating signed URL",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
         raise
 
 
+# video_id -> in-flight on-demand thumbnail generation. Concurrent cold-path
+# requests for the same video await the same task instead of each downloading
+# the video and extracting a frame.
+_thumbnail_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def _generate_thumbnail_task(video_id: str) -> Optional[dict]:
+    """Generate a thumbnail on its own session, bounded by the global limit."""
+    # Bound distinct videos generating at once: each one downloads a video
+    # and decodes a frame with OpenCV, so a cold list render would
+    # otherwise start one per card
+    async with GlobalConcurrencyLimits.get().thumbnail_generation:
+        # Own session: the task outlives any single request that awaits it
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            return await generate_thumbnail_async(video_id, session)
+
+
+def _thumbnail_task_done(video_id: str, task: asyncio.Task) -> None:
+    """Drop a finished generation from the in-flight map."""
+    if _thumbnail_inflight.get(video_id) is task:
+        del _thumbnail_inflight[video_id]
+    if not task.cancelled():
+        # Mark retrieved so an error nobody awaited isn't reported as unhandled
+        task.exception()
+
+
+async def _generate_thumbnail_once(video_id: str) -> Optional[dict]:
+    """Run generate_thumbnail_async once per video, shared by concurrent callers."""
+    task = _thumbnail_inflight.get(video_id)
+    if task is None:
+        task = asyncio.create_task(_generate_thumbnail_task(video_id))
+        _thumbnail_inflight[video_id] = task
+        task.add_done_callback(partial(_thumbnail_task_done, video_id))
+    # shield: a client disconnecting cancels only its own wait, never the
+    # shared generation other requests are waiting on
+    return await asyncio.shield(task)
+
+
+# video_id -> (monotonic time, thumbnail GCS path) for thumbnails whose DB row
+# and blob were confirmed recently. Lets the thumbnail redirect, hit once per
+# card on every list render, skip the DB lookup while the uploader's
+# signed-URL cache is warm.
+_THUMBNAIL_CLOUD_URL_TTL = 300.0
+_THUMBNAIL_CLOUD_URL_MAX = 10_000
+_thumbnail_cloud_urls: Dict[str, Tuple[float, str]] = {}
+
+
+def _remember_thumbnail_cloud_url(video_id: str, cloud_url: str) -> None:
+    """Record a confirmed thumbnail blob path for the redirect fast path."""
+    if len(_thumbnail_cloud_urls) >= _THUMBNAIL_CLOUD_URL_MAX:
+        _thumbnail_cloud_urls.clear()
+    _thumbnail_cloud_urls[video_id] = (time.monotonic(), cloud_url)
+
+
+async def _resolve_thumbnail_signed_url(
+    video_id: str,
+    db: AsyncSession,
+    function: str,
+    regenerate_missing_blob: bool = True,
+) -> Tuple[Optional[str], bool]:
+    """
+    Resolve a signed URL for a video's thumbnail, generating it if needed.
+
+    Shared by the redirect and JSON thumbnail endpoints so both follow the same
+    fast/slow path and share the uploader's signed-URL cache.
+
+    Args:
+        video_id: Video identifier
+        db: Request database session
+        function: Calling endpoint name, used in log events
+        regenerate_missing_blob: If False, a DB row whose GCS blob is gone
+            raises 404 instead of deleting the row and regenerating inline
+
+    Returns:
+        Tuple of (signed URL or None if the video was not found or generation
+        failed, True if the thumbnail was generated during this call)
+
+    Raises:
+        HTTPException 404: Blob missing and regenerate_missing_blob is False
+        HTTPException 500: Thumbnail generated but no signed URL was returned
+    """
+    uploader = get_uploader()
+
+    # Fastest path: blob path already confirmed by an earlier request. A
+    # vanished blob makes the signed-URL lookup return None, so the entry is
+    # dropped and the DB path below re-checks (and cleans up) as usual.
+    known = _thumbnail_cloud_urls.get(video_id)
+    if known is not None and time.monotonic() - known[0] < _THUMBNAIL_CLOUD_URL_TTL:
+        signed_url = await uploader.get_thumbnail_signed_url_async(known[1])
+        if signed_url:
+            return signed_url, False
+    _thumbnail_cloud_urls.pop(video_id, None)
+
+    # Fast path: thumbnail already in DB
+    thumbnail = await thumbnail_db_repository.get_by_video_identifier(db, video_id)
+
+    if thumbnail:
+        signed_url = await uploader.get_thumbnail_signed_url_async(thumbnail.cloud_url)
+        if signed_url:
+            _remember_thumbnail_cloud_url(video_id, thumbnail.cloud_url)
+            return signed_url, False
+
+        if not regenerate_missing_blob:
+            raise HTTPException(status_code=404, detail="Thumbnail not available in cloud storage")
+
+        # Blob gone from GCS but DB record exists — clean up and regenerate
+        log_event(
+            level="WARNING",
+            logger=_LOGGER,
+            function=function,
+            operation=function,
+            event="gcs_blob_missing",
+            message="Thumbnail in DB but blob missing from GCS, regenerating",
+            context={"video_id": video_id, "cloud_url": thumbnail.cloud_url}
+        )
+        await thumbnail_db_repository.delete_by_video_id(db, thumbnail.video_id)
+        await db.commit()
+
+    # Slow path: generate thumbnail on-demand
+    log_event(
+        level="INFO",
+        logger=_LOGGER,
+        function=function,
+        operation=function,
+        event="thumbnail_generation_start",
+        message="Generating thumbnail on-demand",
+        context={"video_id": video_id}
+    )
+
+    result = await _generate_thumbnail_once(video_id)
+    if not result:
+        return None, True
+
+    if not result.get("signed_url"):
+        raise HTTPException(status_code=500, detail="Failed to generate thumbnail URL")
+
+    _remember_thumbnail_cloud_url(video_id, result["cloud_url"])
+    return result["signed_url"], True
+
+
 @router.get("/videos/{video_id}/thumbnail")
-async def get_thumbnail(video_id: str, db: AsyncSession = Depends(get_db)):
+async def get_thumbnail(video_id: str, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """
     Get video thumbnail via GCS signed URL redirect.
 
@@ -363,67 +584,26 @@ async def get_thumbnail(video_id: str, db: AsyncSession = Depends(get_db)):
     Slow path (~1-10s): thumbnail missing → download video from GCS → extract frame →
                         upload to GCS → insert DB record → 302 redirect.
     """
-    start_time = time.time()
     operation = "get_thumbnail"
 
-    log_operation_start(
-        logger="app.api.endpoints.videos",
+    log_event_lazy(
+        level="DEBUG",
+        logger=_LOGGER,
         function="get_thumbnail",
         operation=operation,
-        message=f"Getting thumbnail for {video_id}",
-        context={"video_id": video_id, "request_id": get_request_id()}
+        event="operation_start",
+        message="Getting thumbnail for %s",
+        args=(video_id,),
+        context_factory=lambda: {"video_id": video_id, **ctx}
     )
 
     try:
-        # Fast path: thumbnail already in DB
-        thumbnail = await thumbnail_db_repository.get_by_video_identifier(db, video_id)
-
-        if thumbnail:
-            from app.services.pipeline.upload_service import GCSUploader
-            uploader = GCSUploader()
-            signed_url = uploader.get_thumbnail_signed_url(thumbnail.cloud_url)
-
-            if signed_url:
-                duration = time.time() - start_time
-                log_operation_complete(
-                    logger="app.api.endpoints.videos",
-                    function="get_thumbnail",
-                    operation=operation,
-                    message="Redirecting to existing GCS thumbnail",
-                    context={"video_id": video_id, "duration_seconds": duration}
-                )
-                return RedirectResponse(url=signed_url, status_code=302)
-
-            # Blob gone from GCS but DB record exists — clean up and regenerate
-            log_event(
-                level="WARNING",
-                logger="app.api.endpoints.videos",
-                function="get_thumbnail",
-                operation=operation,
-                event="gcs_blob_missing",
-                message="Thumbnail in DB but blob missing from GCS, regenerating",
-                context={"video_id": video_id, "cloud_url": thumbnail.cloud_url}
-            )
-            await thumbnail_db_repository.delete_by_video_id(db, thumbnail.video_id)
-            await db.commit()
+        signed_url, generated = await _resolve_thumbnail_signed_url(video_id, db, "get_thumbnail")
 
-        # Slow path: generate thumbnail on-demand
-        log_event(
-            level="INFO",
-            logger="app.api.endpoints.videos",
-            function="get_thumbnail",
-            operation=operation,
-            event="thumbnail_generation_start",
-            message="Generating thumbnail on-demand",
-            context={"video_id": video_id}
-        )
-
-        result = await generate_thumbnail_async(video_id, db)
-
-        if not result:
+        if not signed_url:
             log_event(
                 level="WARNING",
-                logger="app.api.endpoints.videos",
+                logger=_LOGGER,
                 function="get_thumbnail",
                 operation=operation,
                 event="validation_error",
@@ -432,37 +612,44 @@ async def get_thumbnail(video_id: str, db: AsyncSession = Depends(get_db)):
             )
             raise HTTPException(status_code=404, detail="Video not found")
 
-        if not result.get("signed_url"):
-            raise HTTPException(status_code=500, detail="Failed to generate thumbnail URL")
-
-        duration = time.time() - start_time
-        log_operation_complete(
-            logger="app.api.endpoints.videos",
-            function="get_thumbnail",
-            operation=operation,
-            message="Thumbnail generated and redirecting to GCS",
-            context={"video_id": video_id, "duration_seconds": duration}
-        )
+        if generated:
+            log_operation_complete(
+                logger=_LOGGER,
+                function="get_thumbnail",
+                operation=operation,
+                message="Thumbnail generated and redirecting to GCS",
+                context={"video_id": video_id}
+            )
+        else:
+            # Fast path runs once per thumbnail on every list render; keep it at DEBUG
+            log_event_lazy(
+                level="DEBUG",
+                logger=_LOGGER,
+                function="get_thumbnail",
+                operation=operation,
+                event="operation_complete",
+                message="Redirecting to existing GCS thumbnail",
+                context_factory=lambda: {"video_id": video_id}
+            )
 
-        return RedirectResponse(url=result["signed_url"], status_code=302)
+        return RedirectResponse(url=signed_url, status_code=302)
 
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="get_thumbnail",
             operation=operation,
             error=e,
             message="Error getting thumbnail",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
         raise HTTPException(status_code=500, detail=f"Error getting thumbnail: {str(e)}")
 
 
 @router.get("/videos/{video_id}/thumbnail/url")
-async def get_thumbnail_url(video_id: str, db: AsyncSession = Depends(get_db)):
+async def get_thumbnail_url(video_id: str, db: AsyncSession = Depends(get_db), ctx: dict = Depends(get_request_context)):
     """
     Get thumbnail signed URL as JSON with expiry information.
 
@@ -476,48 +663,38 @@ async def get_thumbnail_url(video_id: str, db: AsyncSession = Depends(get_db)):
             "video_identifier": "motivation"
         }
     """
-    start_time = time.time()
     operation = "get_thumbnail_url"
 
-    log_event(
+    log_event_lazy(
         level="DEBUG",
-        logger="app.api.endpoints.videos",
+        logger=_LOGGER,
         function="get_thumbnail_url",
         operation=operation,
         event="operation_start",
-        message=f"Getting thumbnail URL for video {video_id}",
-        context={"video_id": video_id, "request_id": get_request_id()}
+        message="Getting thumbnail URL for video %s",
+        args=(video_id,),
+        context_factory=lambda: {"video_id": video_id, **ctx}
     )
 
     try:
-        thumbnail = await thumbnail_db_repository.get_by_video_identifier(db, video_id)
-
-        if not thumbnail:
-            # Attempt on-demand generation
-            result = await generate_thumbnail_async(video_id, db)
-            if not result:
-                raise HTTPException(status_code=404, detail="Video not found or thumbnail could not be generated")
-            signed_url = result.get("signed_url")
-        else:
-            from app.services.pipeline.upload_service import GCSUploader
-            uploader = GCSUploader()
-            signed_url = uploader.get_thumbnail_signed_url(thumbnail.cloud_url)
-            if not signed_url:
-                raise HTTPException(status_code=404, detail="Thumbnail not available in cloud storage")
+        # A row whose blob is gone is a 404 here, so this URL lookup
+        # never turns into a video download and frame decode
+        signed_url, _ = await _resolve_thumbnail_signed_url(
+            video_id, db, "get_thumbnail_url", regenerate_missing_blob=False
+        )
+        if not signed_url:
+            raise HTTPException(status_code=404, detail="Video not found or thumbnail could not be generated")
 
-        from app.core.config import get_settings
-        settings = get_settings()
-        expires_in_seconds = int(settings.gcs_signed_url_expiry_hours * 3600)
+        expires_in_seconds = _signed_url_expires_in()
 
-        duration = time.time() - start_time
-        log_event(
+        log_event_lazy(
             level="DEBUG",
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="get_thumbnail_url",
             operation=operation,
             event="operation_complete",
             message="Generated thumbnail signed URL",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context_factory=lambda: {"video_id": video_id}
         )
 
         return {
@@ -529,13 +706,12 @@ async def get_thumbnail_url(video_id: str, db: AsyncSession = Depends(get_db)):
     except HTTPException:
         raise
     except Exception as e:
-        duration = time.time() - start_time
         log_operation_error(
-            logger="app.api.endpoints.videos",
+            logger=_LOGGER,
             function="get_thumbnail_url",
             operation=operation,
             error=e,
             message="Error getting thumbnail URL",
-            context={"video_id": video_id, "duration_seconds": duration}
+            context={"video_id": video_id}
         )
         raise HTTPException(status_code=500, detail=f"Error getting thumbnail URL: {str(e)}")
@@ -12,27 +12,57 @@ Usage:
 """
 import sys
 import argparse
+import asyncio
 from pathlib import Path
 
-# Ensure app is in path — resolves to moments-backend/ regardless of where the CLI is invoked from
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+# When run as a plain script (python app/cli/model_config.py) the backend root
+# is not on sys.path; `python -m app.cli.model_config` and imports already have it
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
-from app.services.config_registry import get_config_registry, ModelConfigNotFoundError
-from app.utils.model_config import seed_default_configs, DEFAULT_MODELS
+# App modules (Redis client, settings, registry) are imported inside each
+# command, so `--help` and usage errors never load them.
 
 
-def list_configs():
+# Config fields settable from the command line; argparse types each value
+_CONFIG_FIELDS = ('name', 'host', 'port', 'model_id', 'supports_video', 'top_p', 'top_k')
+
+
+# Accepted confirmations for `delete`
+_YES = frozenset({'yes', 'y'})
+
+# Field order for `show`; any other stored fields follow alphabetically
+_DISPLAY_ORDER = ('name', 'model_id', 'host', 'port', 'supports_video', 'top_p', 'top_k', 'updated_at')
+_DISPLAY_KEYS = frozenset(_DISPLAY_ORDER)
+
+
+def _config_fields_from_args(args) -> dict:
+    """Collect the config fields given on the command line."""
+    return {
+        field: value
+        for field in _CONFIG_FIELDS
+        if (value := getattr(args, field)) is not None
+    }
+
+
+async def list_configs():
     """List all model configurations."""
+    from app.services.config_registry import get_config_registry
+
     registry = get_config_registry()
-    configs = registry.list_configs()
+    configs = await registry.list_configs()
 
     if not configs:
         print("No model configs found in Redis.")
         print("Run 'python -m app.cli.model_config seed' to initialize.")
         return
 
-    print(f"\n{'Model Key':<20} {'Name':<20} {'Host':<25} {'Port':<8} {'Video':<8} {'Updated':<20}")
-    print("=" * 105)
+    # Build the table and write it once instead of one print per row
+    lines = [
+        "",
+        f"{'Model Key':<20} {'Name':<20} {'Host':<25} {'Port':<8} {'Video':<8} {'Updated':<20}",
+        "=" * 105,
+    ]
 
     for config in configs:
         model_key = config.get('model_key', 'N/A')
@@ -44,48 +74,40 @@ def list_configs():
         if updated != 'N/A' and 'T' in updated:
             updated = updated.split('T')[0]
 
-        print(f"{model_key:<20} {name:<20} {host:<25} {port:<8} {supports_video:<8} {updated:<20}")
+        lines.append(f"{model_key:<20} {name:<20} {host:<25} {port:<8} {supports_video:<8} {updated:<20}")
 
-    print(f"\nTotal: {len(configs)} model(s)")
+    lines.append(f"\nTotal: {len(configs)} model(s)")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def show_config(model_key: str):
+async def show_config(model_key: str):
     """Show detailed configuration for a specific model."""
+    from app.services.config_registry import get_config_registry, ModelConfigNotFoundError
+
     registry = get_config_registry()
 
     try:
-        config = registry.get_config(model_key)
+        config = await registry.get_config(model_key)
 
         print(f"\nConfiguration for '{model_key}':")
         print("=" * 60)
-        for key, value in sorted(config.items()):
-            print(f"  {key:<20}: {value}")
+        keys = [key for key in _DISPLAY_ORDER if key in config]
+        keys.extend(sorted(config.keys() - _DISPLAY_KEYS))
+        for key in keys:
+            print(f"  {key:<20}: {config[key]}")
 
     except ModelConfigNotFoundError as e:
         print(f"\nError: {e}")
         print(f"Available models: {e.available_keys}")
 
 
-def set_config(model_key: str, args):
+async def set_config(model_key: str, args):
     """Set/create full configuration for a model."""
+    from app.services.config_registry import get_config_registry
+
     registry = get_config_registry()
 
-    config = {}
-
-    if args.name:
-        config['name'] = args.name
-    if args.host:
-        config['host'] = args.host
-    if args.port is not None:
-        config['port'] = int(args.port)
-    if args.model_id is not None:
-        config['model_id'] = args.model_id
-    if args.supports_video is not None:
-        config['supports_video'] = args.supports_video
-    if args.top_p is not None:
-        config['top_p'] = float(args.top_p)
-    if args.top_k is not None:
-        config['top_k'] = int(args.top_k)
+    config = _config_fields_from_args(args)
 
     if not config:
         print("Error: No configuration fields provided")
@@ -99,48 +121,37 @@ def set_config(model_key: str, args):
         print("For partial updates, use 'update' command instead")
         return
 
-    registry.set_config(model_key, config)
+    await registry.set_config(model_key, config)
     print(f"\n✓ Configuration for '{model_key}' saved successfully")
-    show_config(model_key)
+    await show_config(model_key)
 
 
-def update_config(model_key: str, args):
+async def update_config(model_key: str, args):
     """Partially update configuration for a model."""
+    from app.services.config_registry import get_config_registry, ModelConfigNotFoundError
+
     registry = get_config_registry()
 
-    updates = {}
-
-    if args.name:
-        updates['name'] = args.name
-    if args.host:
-        updates['host'] = args.host
-    if args.port is not None:
-        updates['port'] = int(args.port)
-    if args.model_id is not None:
-        updates['model_id'] = args.model_id
-    if args.supports_video is not None:
-        updates['supports_video'] = args.supports_video
-    if args.top_p is not None:
-        updates['top_p'] = float(args.top_p)
-    if args.top_k is not None:
-        updates['top_k'] = int(args.top_k)
+    updates = _config_fields_from_args(args)
 
     if not updates:
         print("Error: No fields to update")
         return
 
     try:
-        registry.update_config(model_key, updates)
+        await registry.update_config(model_key, updates)
         print(f"\n✓ Updated '{model_key}' — fields: {list(updates.keys())}")
-        show_config(model_key)
+        await show_config(model_key)
     except ModelConfigNotFoundError as e:
         print(f"\nError: {e}")
         print(f"Available models: {e.available_keys}")
 
 
-def seed_configs(force: bool = False):
+async def seed_configs(force: bool = False):
     """Seed Redis with default configurations."""
-    count = seed_default_configs(force=force)
+    from app.utils.model_config import seed_default_configs, DEFAULT_MODELS
+
+    count = await seed_default_configs(force=force)
 
     if force:
         print(f"\n✓ Force-seeded {count} model configs (overwrote existing)")
@@ -152,16 +163,18 @@ def seed_configs(force: bool = False):
         print(f"  - {model_key}")
 
 
-def delete_config(model_key: str):
+async def delete_config(model_key: str):
     """Delete a model configuration."""
+    from app.services.config_registry import get_config_registry
+
     registry = get_config_registry()
 
     response = input(f"\nAre you sure you want to delete config for '{model_key}'? (yes/no): ")
-    if response.lower() not in ['yes', 'y']:
+    if response.strip().lower() not in _YES:
         print("Deletion cancelled")
         return
 
-    deleted = registry.delete_config(model_key)
+    deleted = await registry.delete_config(model_key)
 
     if deleted:
         print(f"\n✓ Configuration for '{model_key}' deleted successfully")
@@ -169,6 +182,33 @@ def delete_config(model_key: str):
         print(f"\n✗ Configuration for '{model_key}' not found")
 
 
+async def _run_command(args, parser):
+    """
+    Dispatch a CLI command inside one event loop.
+
+    All registry calls made by the command (e.g. set followed by show) share
+    the pooled async Redis client, which is closed once the command finishes.
+    """
+    try:
+        if args.command == 'list':
+            await list_configs()
+        elif args.command == 'show':
+            await show_config(args.model_key)
+        elif args.command == 'set':
+            await set_config(args.model_key, args)
+        elif args.command == 'update':
+            await update_config(args.model_key, args)
+        elif args.command == 'seed':
+            await seed_configs(force=args.force)
+        elif args.command == 'delete':
+            await delete_config(args.model_key)
+        else:
+            parser.print_help()
+    finally:
+        from app.core.redis import close_async_redis_client
+        await close_async_redis_client()
+
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -210,7 +250,7 @@ Examples:
     set_parser.add_argument('--host', help='Host the application calls (IP, hostname, or localhost)')
     set_parser.add_argument('--port', type=int, help='Port the application calls')
     set_parser.add_argument('--model-id', help='Model ID for API calls')
-    set_parser.add_argument('--supports-video', type=bool, help='Supports video input')
+    set_parser.add_argument('--supports-video', action=argparse.BooleanOptionalAction, help='Supports video input')
     set_parser.add_argument('--top-p', type=float, help='Sampling top_p')
     set_parser.add_argument('--top-k', type=int, help='Sampling top_k')
 
@@ -221,7 +261,7 @@ Examples:
     update_parser.add_argument('--host', help='Host the application calls')
     update_parser.add_argument('--port', type=int, help='Port the application calls')
     update_parser.add_argument('--model-id', help='Model ID for API calls')
-    update_parser.add_argument('--supports-video', type=bool, help='Supports video input')
+    update_parser.add_argument('--supports-video', action=argparse.BooleanOptionalAction, help='Supports video input')
     update_parser.add_argument('--top-p', type=float, help='Sampling top_p')
     update_parser.add_argument('--top-k', type=int, help='Sampling top_k')
 
@@ -240,20 +280,7 @@ Examples:
         return
 
     try:
-        if args.command == 'list':
-            list_configs()
-        elif args.command == 'show':
-            show_config(args.model_key)
-        elif args.command == 'set':
-            set_config(args.model_key, args)
-        elif args.command == 'update':
-            update_config(args.model_key, args)
-        elif args.command == 'seed':
-            seed_configs(force=args.force)
-        elif args.command == 'delete':
-            delete_config(args.model_key)
-        else:
-            parser.print_help()
+        asyncio.run(_run_command(args, parser))
 
     except Exception as e:
         print(f"\nError: {e}")
@@ -3,10 +3,14 @@ Application configuration using Pydantic Settings.
 All configuration values can be overridden via environment variables or .env file.
 """
 import os
-from pydantic_settings import BaseSettings
+from functools import cached_property, lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
 from typing import Optional, List
 
+# Backend root; relative credential paths resolve against it
+_BACKEND_DIR = Path(__file__).parent.parent.parent
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
@@ -153,7 +157,7 @@ class Settings(BaseSettings):
     video_download_timeout_seconds: int = 1800  # 30 minutes
     video_download_max_size_bytes: int = 10 * 1024 * 1024 * 1024  # 10 GB
     video_download_max_concurrent: int = 2
-    video_download_chunk_size: int = 8192  # 8 KB chunks
+    video_download_chunk_size: int = 1024 * 1024  # 1 MB chunks (one progress update per chunk)
     video_download_retry_count: int = 3
     video_download_retry_base_delay: float = 2.0
     
@@ -165,6 +169,7 @@ class Settings(BaseSettings):
     moment_generation_max_concurrent: int = 2  # Max concurrent AI generation calls
     clip_extraction_max_concurrent: int = 4  # Max total FFmpeg clip extractions
     refinement_max_concurrent: int = 1  # Max concurrent refinement API calls
+    thumbnail_generation_max_concurrent: int = 2  # Max concurrent on-demand thumbnail generations
     
     # Generic filename patterns (trigger hash-based ID)
     video_download_generic_names: List[str] = [
@@ -172,35 +177,31 @@ class Settings(BaseSettings):
         "temp", "file", "movie", "media"
     ]
     
-    @property
+    @cached_property
     def gcs_credentials_path(self) -> Optional[Path]:
-        """Get the full path to GCS service account credentials."""
+        """Get the full path to GCS service account credentials (resolved once; settings are frozen)."""
         if self.gcs_service_account_file:
+            credentials_file = Path(self.gcs_service_account_file)
             # If absolute path provided, use it
-            if Path(self.gcs_service_account_file).is_absolute():
-                return Path(self.gcs_service_account_file)
+            if credentials_file.is_absolute():
+                return credentials_file
             
             # Otherwise, treat as relative to backend root
-            backend_dir = Path(__file__).parent.parent.parent
-            return backend_dir / self.gcs_service_account_file
+            return _BACKEND_DIR / credentials_file
         
         return None
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-    
-
-
-# Global settings instance (lazily initialized)
-_settings: Optional[Settings] = None
+    # frozen: the instance is shared process-wide via get_settings(), so
+    # fields are read-only after load
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        frozen=True,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
-
+    """Get the global settings instance (built once; get_settings.cache_clear() resets it)."""
+    return Settings()
@@ -11,7 +11,7 @@ import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from contextvars import ContextVar
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable
 import traceback
 import functools
 
@@ -259,7 +259,8 @@ def log_event(
     event: Optional[str] = None,
     message: str = "",
     context: Optional[Dict[str, Any]] = None,
-    exc_info: Optional[Exception] = None
+    exc_info: Optional[Exception] = None,
+    args: tuple = ()
 ) -> None:
     """
     Log a structured event.
@@ -270,9 +271,12 @@ def log_event(
         function: Function name where log originated
         operation: High-level operation name
         event: Specific event type
-        message: Human-readable message
+        message: Human-readable message, optionally with %-style placeholders
         context: Operation-specific data
         exc_info: Exception info to include
+        args: Values for the %-style placeholders in message. Formatting is
+              deferred to the logging module and skipped entirely when the
+              level is filtered out.
     """
     logger_instance = logging.getLogger(logger)
     log_method = getattr(logger_instance, level.lower(), logger_instance.info)
@@ -289,14 +293,56 @@ def log_event(
         old_operation = _operation.get()
         _operation.set(operation)
         try:
-            log_method(message, extra=extra, exc_info=exc_info)
+            log_method(message, *args, extra=extra, exc_info=exc_info)
         finally:
             if old_operation:
                 _operation.set(old_operation)
             else:
                 _operation.set(None)
     else:
-        log_method(message, extra=extra, exc_info=exc_info)
+        log_method(message, *args, extra=extra, exc_info=exc_info)
+
+
+def log_event_lazy(
+    level: str,
+    logger: str,
+    function: str,
+    operation: Optional[str] = None,
+    event: Optional[str] = None,
+    message: str = "",
+    context_factory: Optional[Callable[[], Dict[str, Any]]] = None,
+    args: tuple = ()
+) -> None:
+    """
+    Log a structured event, building the context only if it will be emitted.
+
+    Same as log_event(), but takes a zero-argument context factory instead of
+    a context dict. When the level is filtered out (e.g. DEBUG in production)
+    the factory never runs and the message is never formatted, so hot paths
+    don't allocate and discard context dicts on every request.
+    
+    Args:
+        level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        logger: Logger name (usually module path)
+        function: Function name where log originated
+        operation: High-level operation name
+        event: Specific event type
+        message: Human-readable message, optionally with %-style placeholders
+        context_factory: Callable returning operation-specific data
+        args: Values for the %-style placeholders in message
+    """
+    if not logging.getLogger(logger).isEnabledFor(getattr(logging, level.upper(), logging.INFO)):
+        return
+    log_event(
+        level=level,
+        logger=logger,
+        function=function,
+        operation=operation,
+        event=event,
+        message=message,
+        context=context_factory() if context_factory else None,
+        args=args
+    )
 
 
 def log_operation_start(
@@ -304,7 +350,8 @@ def log_operation_start(
     function: str,
     operation: str,
     message: str = "",
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None,
+    args: tuple = ()
 ) -> None:
     """Log the start of an operation."""
     set_operation(operation)
@@ -315,7 +362,8 @@ def log_operation_start(
         operation=operation,
         event="operation_start",
         message=message or f"Starting {operation}",
-        context=context
+        context=context,
+        args=args
     )
 
 
@@ -325,7 +373,8 @@ def log_operation_complete(
     operation: str,
     message: str = "",
     context: Optional[Dict[str, Any]] = None,
-    duration: Optional[float] = None
+    duration: Optional[float] = None,
+    args: tuple = ()
 ) -> None:
     """Log the completion of an operation."""
     if context is None:
@@ -340,7 +389,8 @@ def log_operation_complete(
         operation=operation,
         event="operation_complete",
         message=message or f"Completed {operation}",
-        context=context
+        context=context,
+        args=args
     )
 
 
@@ -350,7 +400,8 @@ def log_operation_error(
     operation: str,
     error: Exception,
     message: str = "",
-    context: Optional[Dict[str, Any]] = None
+    context: Optional[Dict[str, Any]] = None,
+    args: tuple = ()
 ) -> None:
     """Log an operation error."""
     if context is None:
@@ -367,7 +418,8 @@ def log_operation_error(
         event="operation_error",
         message=message or f"Error in {operation}",
         context=context,
-        exc_info=error
+        exc_info=error,
+        args=args
     )
 
 
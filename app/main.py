@@ -3,6 +3,7 @@ import asyncio
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import get_settings
 from app.core.logging import setup_logging
@@ -16,7 +17,8 @@ from app.workers.pipeline_worker import ensure_pipeline_consumer_group, start_pi
 # Initialize logging system
 setup_logging(log_level="INFO")
 
-app = FastAPI(title="Video Moments API", version="1.0.0")
+# orjson for every JSON response (endpoints that build their own Response are unaffected)
+app = FastAPI(title="Video Moments API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Add middleware (order matters - last added runs first)
 app.add_middleware(RequestLoggingMiddleware)
@@ -139,7 +141,15 @@ async def startup_event():
         logger.info("Database connection pool initialized")
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
-    
+
+    # Warm the GCS uploader so the first request doesn't pay the auth handshake
+    try:
+        from app.services.pipeline.upload_service import get_uploader
+        get_uploader()
+        logger.info("GCS uploader initialized")
+    except Exception as e:
+        logger.error(f"Failed to initialize GCS uploader: {e}")
+
     # Auto-seed model configs if Redis is empty
     try:
         from app.services.config_registry import get_config_registry
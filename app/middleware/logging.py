@@ -29,7 +29,8 @@ def _is_polling_endpoint(path: str, method: str) -> bool:
     """Return True for GET requests that are pure UI polling or routine data reads.
 
     These requests happen many times per second and add no meaningful information
-    to the log file.  Errors from these endpoints are still always logged.
+    to the log file.  Raised errors and error responses (status >= 400) from
+    these endpoints are still always logged, with the request duration.
     """
     if method != "GET":
         return False
@@ -62,54 +63,68 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         request_id = request.headers.get("X-Request-ID") or generate_request_id()
         set_request_id(request_id)
         
+        # Read the raw scope path once; request.url builds a full URL object
+        path = request.scope["path"]
+        method = request.method
+
         # Store start time
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        # Polling / routine-read endpoints are logged silently (errors still logged below)
-        is_polling_endpoint = _is_polling_endpoint(request.url.path, request.method)
+        # Polling / routine-read endpoints take a fast path: no request/response
+        # log payloads are built, only the request ID header and error logging
+        if _is_polling_endpoint(path, method):
+            try:
+                response = await call_next(request)
+            except Exception as e:
+                self._log_request_error(method, path, start_time, e)
+                raise
+            # Only 2xx/3xx stay quiet; returned error responses (HTTPException,
+            # explicit 404/500 bodies) get one line with their latency
+            if response.status_code >= 400:
+                self._log_error_response(method, path, start_time, response.status_code)
+            response.headers["X-Request-ID"] = request_id
+            return response
 
-        if not is_polling_endpoint:
-            # Log request received
+        # Log request received
+        log_event(
+            level="INFO",
+            logger="app.middleware.logging",
+            function="dispatch",
+            operation="http_request",
+            event="request_received",
+            message=f"Request received: {method} {path}",
+            context={
+                "method": method,
+                "path": path,
+                "query_params": dict(request.query_params),
+                "client_host": request.client.host if request.client else None,
+                "user_agent": request.headers.get("user-agent"),
+                "content_type": request.headers.get("content-type"),
+                "content_length": request.headers.get("content-length"),
+            }
+        )
+        
+        try:
+            # Process request
+            response = await call_next(request)
+            
+            # Calculate duration
+            duration = time.monotonic() - start_time
+            
+            # Log response
             log_event(
                 level="INFO",
                 logger="app.middleware.logging",
                 function="dispatch",
                 operation="http_request",
-                event="request_received",
-                message=f"Request received: {request.method} {request.url.path}",
+                event="response_sent",
+                message=f"Response sent: {method} {path}",
                 context={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "query_params": dict(request.query_params),
-                    "client_host": request.client.host if request.client else None,
-                    "user_agent": request.headers.get("user-agent"),
-                    "content_type": request.headers.get("content-type"),
-                    "content_length": request.headers.get("content-length"),
+                    "status_code": response.status_code,
+                    "duration_seconds": duration,
+                    "response_headers": dict(response.headers),
                 }
             )
-        
-        try:
-            # Process request
-            response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            if not is_polling_endpoint:
-                # Log response
-                log_event(
-                    level="INFO",
-                    logger="app.middleware.logging",
-                    function="dispatch",
-                    operation="http_request",
-                    event="response_sent",
-                    message=f"Response sent: {request.method} {request.url.path}",
-                    context={
-                        "status_code": response.status_code,
-                        "duration_seconds": duration,
-                        "response_headers": dict(response.headers),
-                    }
-                )
             
             # Add request ID to response headers
             response.headers["X-Request-ID"] = request_id
@@ -117,23 +132,41 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             return response
             
         except Exception as e:
-            # Calculate duration even on error
-            duration = time.time() - start_time
-            
-            # Always log errors, even for polling endpoints
-            log_event(
-                level="ERROR",
-                logger="app.middleware.logging",
-                function="dispatch",
-                operation="http_request",
-                event="request_error",
-                message=f"Request error: {request.method} {request.url.path}",
-                context={
-                    "duration_seconds": duration,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                },
-                exc_info=e
-            )
+            self._log_request_error(method, path, start_time, e)
             raise
 
+    @staticmethod
+    def _log_error_response(method: str, path: str, start_time: float, status_code: int) -> None:
+        """Log an error status returned by a polling endpoint."""
+        log_event(
+            level="WARNING",
+            logger="app.middleware.logging",
+            function="dispatch",
+            operation="http_request",
+            event="error_response",
+            message=f"Error response: {method} {path} -> {status_code}",
+            context={
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "duration_seconds": time.monotonic() - start_time,
+            }
+        )
+
+    @staticmethod
+    def _log_request_error(method: str, path: str, start_time: float, error: Exception) -> None:
+        """Log a failed request. Errors are always logged, even for polling endpoints."""
+        log_event(
+            level="ERROR",
+            logger="app.middleware.logging",
+            function="dispatch",
+            operation="http_request",
+            event="request_error",
+            message=f"Request error: {method} {path}",
+            context={
+                "duration_seconds": time.monotonic() - start_time,
+                "error_type": type(error).__name__,
+                "error_message": str(error),
+            },
+            exc_info=error
+        )
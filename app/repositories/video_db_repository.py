@@ -2,13 +2,84 @@
 Video database repository - CRUD operations for the videos table.
 This is a database-backed repository (unlike the file-based repositories).
 """
-from typing import Optional
-from sqlalchemy import select, delete, update as sa_update
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import event, select, delete, exists, update as sa_update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.database.models.thumbnail import Thumbnail
+from app.database.models.transcript import Transcript
 from app.database.models.video import Video
 
 
+@dataclass(frozen=True)
+class VideoSnapshot:
+    """Detached, read-only copy of the Video columns the read endpoints use."""
+    id: int
+    identifier: str
+    title: Optional[str]
+    duration_seconds: Optional[float]
+    cloud_url: Optional[str]
+    source_url: Optional[str]
+    created_at: Optional[datetime]
+
+
+# In-process TTL cache for get_snapshot_by_identifier(). Hot video ids are
+# looked up on every stream/url request just to confirm the video exists.
+# The cache is cleared when a session that wrote to videos (through the write
+# functions below or plain ORM attribute changes) commits. Writes made by
+# other processes (the pipeline worker) only become visible once the TTL
+# lapses, so callers that return row contents read through get_by_identifier().
+_SNAPSHOT_CACHE_TTL = 30.0
+_SNAPSHOT_CACHE_MAX = 10_000
+_snapshot_cache: Dict[str, Tuple[float, VideoSnapshot]] = {}
+# Bumped on every invalidation so a lookup that read the row before a commit
+# does not store its (now stale) snapshot after the cache was cleared
+_snapshot_generation = 0
+
+# Session.info flag: this session changed video rows since its last commit
+_VIDEOS_CHANGED = "video_db_repository.videos_changed"
+
+
+def _invalidate_snapshots() -> None:
+    """Drop all cached snapshots (writes are rare, so a full clear is cheapest)."""
+    global _snapshot_generation
+    _snapshot_generation += 1
+    _snapshot_cache.clear()
+
+
+def _mark_videos_changed(session: AsyncSession) -> None:
+    """Invalidate cached snapshots once the session's transaction commits."""
+    session.info[_VIDEOS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _flag_video_orm_writes(session, flush_context) -> None:
+    """Flag sessions whose flush inserted, modified or deleted Video objects."""
+    if any(
+        isinstance(obj, Video)
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[_VIDEOS_CHANGED] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_snapshots_after_commit(session) -> None:
+    """Clear cached snapshots after a commit that changed video rows."""
+    if session.info.pop(_VIDEOS_CHANGED, False):
+        _invalidate_snapshots()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_video_changes(session) -> None:
+    """Rolled-back writes leave the cache valid."""
+    session.info.pop(_VIDEOS_CHANGED, None)
+
+
 async def create(
     session: AsyncSession,
     identifier: str,
@@ -78,6 +149,47 @@ async def get_by_identifier(session: AsyncSession, identifier: str) -> Optional[
     return result.scalar_one_or_none()
 
 
+async def get_snapshot_by_identifier(session: AsyncSession, identifier: str) -> Optional[VideoSnapshot]:
+    """
+    Get a detached snapshot of a video by its identifier, served from a
+    short-lived in-process cache when possible.
+
+    Misses are not cached, so newly created videos are visible immediately.
+    
+    Args:
+        session: Async database session
+        identifier: Video identifier
+    
+    Returns:
+        VideoSnapshot or None if not found
+    """
+    now = time.monotonic()
+    cached = _snapshot_cache.get(identifier)
+    if cached is not None and now - cached[0] < _SNAPSHOT_CACHE_TTL:
+        return cached[1]
+
+    generation = _snapshot_generation
+
+    video = await get_by_identifier(session, identifier)
+    if video is None:
+        return None
+
+    snapshot = VideoSnapshot(
+        id=video.id,
+        identifier=video.identifier,
+        title=video.title,
+        duration_seconds=video.duration_seconds,
+        cloud_url=video.cloud_url,
+        source_url=video.source_url,
+        created_at=video.created_at,
+    )
+    if generation == _snapshot_generation:
+        if len(_snapshot_cache) >= _SNAPSHOT_CACHE_MAX:
+            _snapshot_cache.clear()
+        _snapshot_cache[identifier] = (now, snapshot)
+    return snapshot
+
+
 async def get_by_id(session: AsyncSession, id: int) -> Optional[Video]:
     """
     Get a video by its numeric database ID.
@@ -125,6 +237,34 @@ async def list_all(session: AsyncSession) -> list[Video]:
     return list(result.scalars().all())
 
 
+async def list_all_with_thumbnails(
+    session: AsyncSession,
+) -> List[Tuple[Video, Optional[Thumbnail], bool]]:
+    """
+    List all videos with their thumbnail row and transcript presence in one
+    query, ordered by creation date (newest first).
+    
+    The thumbnail comes from a LEFT OUTER JOIN and transcript presence from
+    a correlated EXISTS, so the listing needs a single round trip.
+    
+    Args:
+        session: Async database session
+    
+    Returns:
+        List of (Video, Thumbnail or None, has_transcript) tuples. The partial
+        unique index on thumbnails.video_id guarantees at most one thumbnail
+        per video.
+    """
+    has_transcript = exists().where(Transcript.video_id == Video.id).label("has_transcript")
+    stmt = (
+        select(Video, Thumbnail, has_transcript)
+        .outerjoin(Thumbnail, Thumbnail.video_id == Video.id)
+        .order_by(Video.created_at.desc())
+    )
+    result = await session.execute(stmt)
+    return [(video, thumbnail, bool(transcribed)) for video, thumbnail, transcribed in result.all()]
+
+
 async def update(session: AsyncSession, id: int, **fields) -> Optional[Video]:
     """
     Update a video record.
@@ -137,6 +277,7 @@ async def update(session: AsyncSession, id: int, **fields) -> Optional[Video]:
     Returns:
         Updated Video instance or None if not found
     """
+    _mark_videos_changed(session)
     stmt = sa_update(Video).where(Video.id == id).values(**fields).returning(Video)
     result = await session.execute(stmt)
     return result.scalar_one_or_none()
@@ -153,6 +294,7 @@ async def delete_by_id(session: AsyncSession, id: int) -> bool:
     Returns:
         True if deleted, False if not found
     """
+    _mark_videos_changed(session)
     stmt = delete(Video).where(Video.id == id)
     result = await session.execute(stmt)
     return result.rowcount > 0
@@ -169,6 +311,7 @@ async def delete_by_identifier(session: AsyncSession, identifier: str) -> bool:
     Returns:
         True if deleted, False if not found
     """
+    _mark_videos_changed(session)
     stmt = delete(Video).where(Video.identifier == identifier)
     result = await session.execute(stmt)
     return result.rowcount > 0
@@ -186,6 +329,7 @@ async def update_by_identifier(session: AsyncSession, identifier: str, **fields)
     Returns:
         Updated Video instance or None if not found
     """
+    _mark_videos_changed(session)
     stmt = sa_update(Video).where(Video.identifier == identifier).values(**fields).returning(Video)
     result = await session.execute(stmt)
     return result.scalar_one_or_none()
@@ -7,6 +7,7 @@ Contains business logic and orchestration for various operations.
 from app.services.audio_service import (
     get_audio_path,
     check_audio_exists,
+    get_identifiers_with_audio,
     extract_audio_from_video,
 )
 
@@ -41,6 +42,7 @@ from app.services.thumbnail_service import (
     get_thumbnail_temp_path,
     extract_frame_from_video,
     get_thumbnail_url_async,
+    thumbnail_urls_from_rows,
     generate_thumbnail_async,
 )
 
@@ -48,6 +50,7 @@ __all__ = [
     # Audio service
     "get_audio_path",
     "check_audio_exists",
+    "get_identifiers_with_audio",
     "extract_audio_from_video",
     
     # Transcript service
@@ -78,6 +81,7 @@ __all__ = [
     "get_thumbnail_temp_path",
     "extract_frame_from_video",
     "get_thumbnail_url_async",
+    "thumbnail_urls_from_rows",
     "generate_thumbnail_async",
 ]
 
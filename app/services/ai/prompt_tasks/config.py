@@ -142,6 +142,18 @@ MODEL_CONFIGS = {
     },
 }
 
+# Configuration for models not listed above, built once per output type
+DEFAULT_MODEL_CONFIGS = {
+    output_type: ModelConfig(
+        json_header=JSON_HEADERS["standard"],
+        json_footer=f"\n\nOutput ONLY valid JSON {output_type}.",
+        header_priority="normal",
+        use_response_format_param=False,
+        response_format_type=None,
+    )
+    for output_type in ("array", "object")
+}
+
 
 def get_model_config(model_key: str, output_type: str) -> ModelConfig:
     """
@@ -165,13 +177,7 @@ def get_model_config(model_key: str, output_type: str) -> ModelConfig:
         return MODEL_CONFIGS[model_key][output_type]
     
     # Default configuration for unknown models
-    return ModelConfig(
-        json_header=JSON_HEADERS["standard"],
-        json_footer=f"\n\nOutput ONLY valid JSON {output_type}.",
-        header_priority="normal",
-        use_response_format_param=False,
-        response_format_type=None,
-    )
+    return DEFAULT_MODEL_CONFIGS[output_type]
 
 
 def get_response_format_param(model_key: str, output_type: str) -> Optional[dict]:
@@ -1,6 +1,9 @@
+import os
 import subprocess
 import time
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterable, Set
 import logging
 from app.utils.logging_config import (
     log_event,
@@ -13,6 +16,12 @@ from app.utils.logging_config import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _identifier_stem(video_identifier: str) -> str:
+    """Identifier stem of a video identifier or filename ("motivation.mp4" -> "motivation")."""
+    return Path(video_identifier).stem
+
+
 def get_audio_path(video_identifier: str) -> Path:
     """
     Get the temp path for an audio file based on the video identifier (stem).
@@ -26,14 +35,41 @@ def get_audio_path(video_identifier: str) -> Path:
         Path to temp/audio/{identifier}/{identifier}.wav
     """
     from app.services.temp_file_manager import get_temp_file_path
-    identifier = Path(video_identifier).stem
+    identifier = _identifier_stem(video_identifier)
     return get_temp_file_path("audio", identifier, f"{identifier}.wav")
 
 
 def check_audio_exists(video_identifier: str) -> bool:
     """Check if a temp audio file exists for the given video identifier."""
     audio_path = get_audio_path(video_identifier)
-    return audio_path.exists() and audio_path.is_file()
+    return audio_path.is_file()
+
+
+def get_identifiers_with_audio(video_identifiers: Iterable[str]) -> Set[str]:
+    """
+    Return which of the given video identifiers have a temp audio file.
+
+    Answers a whole batch from one scandir of temp/audio/ and only stats the
+    .wav of identifiers that have a directory there, instead of resolving
+    (and mkdir-ing) get_audio_path() per identifier.
+    """
+    from app.services.temp_file_manager import get_purpose_dir
+
+    wanted = {_identifier_stem(identifier) for identifier in video_identifiers}
+    present: Set[str] = set()
+    try:
+        with os.scandir(get_purpose_dir("audio")) as entries:
+            for entry in entries:
+                if (
+                    entry.name in wanted
+                    and entry.is_dir(follow_symlinks=False)
+                    and os.path.isfile(os.path.join(entry.path, f"{entry.name}.wav"))
+                ):
+                    present.add(entry.name)
+    except FileNotFoundError:
+        pass
+
+    return present
 
 
 def extract_audio_from_video(video_path: Path, output_path: Path) -> bool:
@@ -74,6 +74,19 @@ class ConfigRegistry:
         # String fields
         return value
     
+    def _queue_config_write(self, pipe, model_key: str, config: Dict) -> None:
+        """Queue the HSET (with a fresh updated_at) and key-set SADD for a config on a pipeline."""
+        config_with_timestamp = config.copy()
+        config_with_timestamp["updated_at"] = datetime.utcnow().isoformat()
+        
+        serialized_config = {
+            k: self._serialize_value(v) 
+            for k, v in config_with_timestamp.items()
+        }
+        
+        pipe.hset(self._get_key(model_key), mapping=serialized_config)
+        pipe.sadd(self.KEYS_SET, model_key)
+    
     async def get_config(self, model_key: str) -> Dict:
         """
         Get full config for a model.
@@ -107,6 +120,23 @@ class ConfigRegistry:
         logger.debug(f"Retrieved config for {model_key} from Redis")
         return config
     
+    async def get_config_field(self, model_key: str, field: str):
+        """
+        Get a single field of a model config with one HGET.
+        
+        Args:
+            model_key: Model identifier
+            field: Config field name (e.g., "supports_video")
+            
+        Returns:
+            Deserialized field value, or None if the model or field is not set
+        """
+        redis = await self._get_redis()
+        value = await redis.hget(self._get_key(model_key), field)
+        if value is None:
+            return None
+        return self._deserialize_value(field, value)
+    
     async def set_config(self, model_key: str, config: Dict) -> None:
         """
         Set/update full config for a model.
@@ -116,23 +146,11 @@ class ConfigRegistry:
             config: Dictionary with configuration fields
         """
         redis = await self._get_redis()
-        redis_key = self._get_key(model_key)
-        
-        # Add timestamp
-        config_with_timestamp = config.copy()
-        config_with_timestamp["updated_at"] = datetime.utcnow().isoformat()
-        
-        # Serialize all values
-        serialized_config = {
-            k: self._serialize_value(v) 
-            for k, v in config_with_timestamp.items()
-        }
-        
-        # Store in Redis hash
-        await redis.hset(redis_key, mapping=serialized_config)
         
-        # Add to keys set
-        await redis.sadd(self.KEYS_SET, model_key)
+        # Store in Redis hash and add to keys set in one MULTI/EXEC round trip
+        async with redis.pipeline(transaction=True) as pipe:
+            self._queue_config_write(pipe, model_key, config)
+            await pipe.execute()
         
         logger.info(f"Stored config for {model_key} in Redis")
     
@@ -197,17 +215,28 @@ class ConfigRegistry:
             List of dictionaries with model_key and config fields
         """
         model_keys = await self.get_registered_keys()
-        configs = []
+        if not model_keys:
+            return []
+        
+        # Fetch every hash in one pipelined round trip instead of one per model
+        redis = await self._get_redis()
+        async with redis.pipeline(transaction=False) as pipe:
+            for model_key in model_keys:
+                pipe.hgetall(self._get_key(model_key))
+            results = await pipe.execute()
         
-        for model_key in model_keys:
-            try:
-                config = await self.get_config(model_key)
-                config["model_key"] = model_key
-                configs.append(config)
-            except ModelConfigNotFoundError:
+        configs = []
+        for model_key, config_data in zip(model_keys, results):
+            if not config_data:
                 # Key in set but no config (shouldn't happen, but handle it)
                 logger.warning(f"Model key {model_key} in set but no config found")
                 continue
+            config = {
+                key: self._deserialize_value(key, value)
+                for key, value in config_data.items()
+            }
+            config["model_key"] = model_key
+            configs.append(config)
         
         return configs
     
@@ -234,23 +263,34 @@ class ConfigRegistry:
             Number of configs seeded
         """
         redis = await self._get_redis()
-        count = 0
-        
-        for model_key, config in defaults.items():
-            redis_key = self._get_key(model_key)
-            exists = await redis.exists(redis_key)
-            
-            if not exists or force:
-                await self.set_config(model_key, config)
-                count += 1
-                logger.info(
-                    f"Seeded config for {model_key} "
-                    f"({'overwritten' if exists else 'created'})"
-                )
-            else:
-                logger.debug(f"Config for {model_key} already exists, skipping")
+        model_keys = list(defaults)
+        
+        # One round trip for all existence checks...
+        async with redis.pipeline(transaction=False) as pipe:
+            for model_key in model_keys:
+                pipe.exists(self._get_key(model_key))
+            existing = await pipe.execute()
+        
+        # ...and one MULTI/EXEC for all writes
+        seeded = []
+        async with redis.pipeline(transaction=True) as pipe:
+            for model_key, exists in zip(model_keys, existing):
+                if not exists or force:
+                    self._queue_config_write(pipe, model_key, defaults[model_key])
+                    seeded.append((model_key, exists))
+                else:
+                    logger.debug(f"Config for {model_key} already exists, skipping")
+            if seeded:
+                await pipe.execute()
+        
+        # Logged only once the transaction has been applied
+        for model_key, exists in seeded:
+            logger.info(
+                f"Seeded config for {model_key} "
+                f"({'overwritten' if exists else 'created'})"
+            )
         
-        return count
+        return len(seeded)
     
     async def clear_all(self) -> int:
         """
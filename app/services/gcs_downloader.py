@@ -8,7 +8,6 @@ import time
 from pathlib import Path
 from typing import Optional, Callable
 from urllib.parse import urlparse
-import aiofiles
 import requests
 from google.cloud import storage
 from google.oauth2 import service_account
@@ -243,29 +242,34 @@ class GCSDownloader:
         async def _do_download():
             nonlocal bytes_downloaded
             
+            # iter_content() blocks on the socket for every chunk, so the whole
+            # read/write loop runs in a worker thread (same as the GCS path)
+            # instead of stalling the event loop between awaits
             loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.get(url, stream=True, timeout=self.timeout)
-            )
-            response.raise_for_status()
             
-            # Open file for writing
-            async with aiofiles.open(dest_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=self.chunk_size):
-                    if chunk:
-                        await f.write(chunk)
-                        bytes_downloaded += len(chunk)
-                        
-                        # Check size limit during download
-                        if bytes_downloaded > self.max_size:
-                            raise ValueError(
-                                f"Download exceeded size limit ({self.max_size} bytes)"
-                            )
-                        
-                        # Progress callback
-                        if progress_callback and content_length:
-                            progress_callback(bytes_downloaded, content_length)
+            def _streamed_download():
+                nonlocal bytes_downloaded
+                bytes_downloaded = 0
+                with requests.get(url, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    with open(str(dest_path), 'wb') as f:
+                        for chunk in response.iter_content(chunk_size=self.chunk_size):
+                            if not chunk:
+                                continue
+                            f.write(chunk)
+                            bytes_downloaded += len(chunk)
+                            
+                            # Check size limit during download
+                            if bytes_downloaded > self.max_size:
+                                raise ValueError(
+                                    f"Download exceeded size limit ({self.max_size} bytes)"
+                                )
+                            
+                            # Progress callback (thread-safe: schedules onto the loop)
+                            if progress_callback and content_length:
+                                progress_callback(bytes_downloaded, content_length)
+            
+            await loop.run_in_executor(None, _streamed_download)
         
         # Download with retry
         await retry_with_backoff(
@@ -424,3 +428,25 @@ class GCSDownloader:
             await self._release_download_slot(video_id)
 
 
+# Singleton instance
+_downloader: Optional[GCSDownloader] = None
+
+
+def get_downloader() -> GCSDownloader:
+    """
+    Get or create the GCSDownloader singleton.
+
+    Building a GCSDownloader reads the service account file and creates a
+    storage client, which every download stage and on-demand local-video
+    fetch used to repeat. The instance keeps no per-download state.
+
+    Returns:
+        GCSDownloader instance
+    """
+    global _downloader
+
+    if _downloader is None:
+        _downloader = GCSDownloader()
+        logger.debug("Initialized GCSDownloader singleton")
+
+    return _downloader
@@ -25,7 +25,7 @@ from app.services.pipeline.lock import (
     check_cancellation,
     clear_cancellation,
 )
-from app.services.pipeline.upload_service import GCSUploader
+from app.services.pipeline.upload_service import GCSUploader, get_uploader
 from app.services.pipeline.orchestrator import execute_pipeline
 
 __all__ = [
@@ -53,6 +53,7 @@ __all__ = [
     "clear_cancellation",
     # Upload
     "GCSUploader",
+    "get_uploader",
     # Orchestrator
     "execute_pipeline",
 ]
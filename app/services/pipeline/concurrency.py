@@ -58,6 +58,9 @@ class GlobalConcurrencyLimits:
         self.refinement = asyncio.Semaphore(
             settings.refinement_max_concurrent
         )
+        self.thumbnail_generation = asyncio.Semaphore(
+            settings.thumbnail_generation_max_concurrent
+        )
         
         logger.info(
             f"Initialized global concurrency limits: "
@@ -65,7 +68,8 @@ class GlobalConcurrencyLimits:
             f"transcription={settings.transcription_max_concurrent}, "
             f"moment_generation={settings.moment_generation_max_concurrent}, "
             f"clip_extraction={settings.clip_extraction_max_concurrent}, "
-            f"refinement={settings.refinement_max_concurrent}"
+            f"refinement={settings.refinement_max_concurrent}, "
+            f"thumbnail_generation={settings.thumbnail_generation_max_concurrent}"
         )
     
     @classmethod
@@ -158,8 +158,9 @@ async def refresh_lock(video_id: str) -> bool:
     lock_key = _get_lock_key(video_id)
     settings = get_settings()
 
-    if await redis.exists(lock_key):
-        await redis.expire(lock_key, settings.pipeline_lock_ttl)
+    # EXPIRE reports whether the key existed, so check and refresh are one
+    # atomic round trip instead of EXISTS followed by EXPIRE
+    if await redis.expire(lock_key, settings.pipeline_lock_ttl):
         logger.debug(f"Refreshed pipeline lock for {video_id}")
         return True
     
@@ -21,7 +21,7 @@ from app.services.pipeline.status import (
     update_sub_stage,
 )
 from app.services.pipeline.lock import check_cancellation, clear_cancellation, refresh_lock
-from app.services.pipeline.upload_service import GCSUploader
+from app.services.pipeline.upload_service import get_uploader
 from app.services.pipeline.concurrency import GlobalConcurrencyLimits
 from app.services.ai.prompt_defaults import DEFAULT_REFINEMENT_PROMPT
 
@@ -58,7 +58,7 @@ async def execute_video_download(video_id: str, config: dict) -> None:
     """
     import json
     import subprocess
-    from app.services.gcs_downloader import GCSDownloader
+    from app.services.gcs_downloader import get_downloader
     from app.database.session import get_session_factory
     from app.repositories import video_db_repository
     
@@ -119,7 +119,7 @@ async def execute_video_download(video_id: str, config: dict) -> None:
                 logger.error(f"Failed to update download progress: {e}")
         
         # Download video
-        downloader = GCSDownloader()
+        downloader = get_downloader()
         
         try:
             success = await downloader.download(
@@ -132,11 +132,12 @@ async def execute_video_download(video_id: str, config: dict) -> None:
             if not success:
                 raise Exception("Download failed")
             
-            # Verify file was created
-            if not dest_path.exists():
+            # Verify file was created (one stat also gives the size)
+            try:
+                file_size = dest_path.stat().st_size
+            except FileNotFoundError:
                 raise Exception("Download completed but file not found")
             
-            file_size = dest_path.stat().st_size
             logger.info(f"Download completed: {dest_path} ({file_size / (1024**2):.2f} MB)")
             
         except Exception as e:
@@ -155,7 +156,9 @@ async def execute_video_download(video_id: str, config: dict) -> None:
     logger.info(f"Extracting video metadata via ffprobe...")
     metadata = {}
     try:
-        result = subprocess.run(
+        # ffprobe can take seconds on large files; keep it off the event loop
+        result = await asyncio.to_thread(
+            subprocess.run,
             [
                 "ffprobe",
                 "-v", "quiet",
@@ -208,7 +211,7 @@ async def execute_video_download(video_id: str, config: dict) -> None:
     # Upload to GCS
     await update_sub_stage(video_id, "uploading_to_cloud")
     logger.info(f"Uploading video to GCS...")
-    uploader = GCSUploader()
+    uploader = get_uploader()
     try:
         gcs_path, signed_url = await uploader.upload_video(dest_path, video_id)
         cloud_url = f"gs://{uploader.bucket_name}/{gcs_path}"
@@ -470,13 +473,10 @@ async def execute_audio_upload(video_id: str, progress_callback=None) -> str:
     Returns:
         Signed URL for the uploaded audio file
     """
-    video_filename = f"{video_id}.mp4"
-    audio_path = get_audio_path(video_filename)
-    
-    if not audio_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+    # upload_audio raises FileNotFoundError itself, so no separate exists() here
+    audio_path = get_audio_path(video_id)
     
-    uploader = GCSUploader()
+    uploader = get_uploader()
     gcs_path, signed_url = await uploader.upload_audio(
         audio_path, 
         video_id,
@@ -629,6 +629,7 @@ async def execute_clip_extraction(video_id: str, config: dict) -> None:
         if not video or not video.cloud_url:
             raise FileNotFoundError(f"Video not found in database: {video_filename}")
         cloud_url = video.cloud_url
+        video_duration = video.duration_seconds
 
     # Use temp path as a placeholder -- extract_clips_parallel will download from cloud_url if needed
     from pathlib import Path
@@ -687,6 +688,7 @@ async def execute_clip_extraction(video_id: str, config: dict) -> None:
         progress_callback=progress_callback,
         cloud_url=cloud_url,
         sub_stage_callback=_on_clips_download_complete,
+        video_duration=video_duration,
     )
 
     if not success:
@@ -782,7 +784,7 @@ async def execute_moment_refinement(video_id: str, config: dict) -> None:
             if config.get("include_video_refinement", True):
                 from app.database.session import get_session_factory
                 from app.repositories import moment_db_repository, clip_db_repository
-                from app.services.pipeline.upload_service import GCSUploader
+                from app.services.pipeline.upload_service import get_uploader
 
                 session_factory = get_session_factory()
                 async with session_factory() as session:
@@ -790,7 +792,7 @@ async def execute_moment_refinement(video_id: str, config: dict) -> None:
                     if moment_record:
                         clip_record = await clip_db_repository.get_by_moment_id(session, moment_record.id)
                         if clip_record:
-                            uploader = GCSUploader()
+                            uploader = get_uploader()
                             video_clip_url = uploader.generate_signed_url(clip_record.cloud_url)
                             logger.info(f"Generated fresh GCS signed URL for clip refinement: {moment_id}")
                         else:
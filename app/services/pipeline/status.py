@@ -7,13 +7,28 @@ All functions are async for non-blocking Redis operations.
 import json
 import time
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from app.core.redis import get_async_redis_client
 from app.core.config import get_settings
 from app.models.pipeline_schemas import PipelineStage, StageStatus
+from app.services.video_response_cache import invalidate_video_responses
 
 logger = logging.getLogger(__name__)
 
+# Short-lived in-process cache in front of get_active_status(). The UI polls
+# the status endpoint every few seconds (often from several tabs), so bursts
+# of polls collapse into a single HGETALL. Writes from this process invalidate
+# the entry immediately; writes from other worker processes become visible
+# once the TTL lapses.
+_ACTIVE_STATUS_CACHE_TTL = 0.5  # seconds
+_ACTIVE_STATUS_CACHE_MAX = 4096
+_active_status_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+
+def _invalidate_status_cache(video_id: str) -> None:
+    """Drop the cached active status for a video after a local write."""
+    _active_status_cache.pop(video_id, None)
+
 
 def _get_status_key(video_id: str) -> str:
     """Get Redis key for ACTIVE pipeline status."""
@@ -90,6 +105,7 @@ async def initialize_status(video_id: str, request_id: str, config: dict) -> Non
     status_data["clip_upload_percentage"] = "0"
     
     await redis.hset(status_key, mapping=status_data)
+    _invalidate_status_cache(video_id)
     # Set TTL so Redis auto-cleans this hash if the worker crashes and never refreshes it.
     await redis.expire(status_key, get_settings().status_ttl_seconds)
     logger.info(f"Initialized pipeline status for {video_id}: {request_id}")
@@ -117,6 +133,7 @@ async def update_stage_status(video_id: str, stage: PipelineStage,
         updates[f"{prefix}_{key}"] = str(value)
     
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
     logger.debug(f"Updated {stage.value} status to {status.value} for {video_id}")
 
 
@@ -139,6 +156,7 @@ async def mark_stage_started(video_id: str, stage: PipelineStage) -> None:
     }
     
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
     logger.info(f"Started stage {stage.value} for {video_id}")
 
 
@@ -165,6 +183,9 @@ async def mark_stage_completed(video_id: str, stage: PipelineStage) -> None:
     }
     
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
+    # Finished stages change what the video list reports (audio, transcript, new video)
+    await invalidate_video_responses(video_id)
     
     # Log with duration if available
     if start_time_str:
@@ -197,6 +218,7 @@ async def mark_stage_skipped(video_id: str, stage: PipelineStage, reason: str) -
     }
     
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
     logger.info(f"Skipped stage {stage.value} for {video_id}: {reason}")
 
 
@@ -223,6 +245,7 @@ async def mark_stage_failed(video_id: str, stage: PipelineStage, error: str) ->
     }
     
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
     logger.error(f"Failed stage {stage.value} for {video_id}: {error}")
 
 
@@ -248,6 +271,7 @@ async def update_sub_stage(video_id: str, sub_stage: str, progress: dict = None)
             mapping[f"sub_stage_{key}"] = str(value)
 
     await redis.hset(status_key, mapping=mapping)
+    _invalidate_status_cache(video_id)
     logger.debug(f"Set sub_stage='{sub_stage}' for {video_id}")
 
 
@@ -263,12 +287,14 @@ async def clear_sub_stage(video_id: str) -> None:
 
     # Reset the sub_stage label
     await redis.hset(status_key, "sub_stage", "")
+    _invalidate_status_cache(video_id)
 
     # Remove any sub_stage_* progress keys that may have been written
     all_fields = await redis.hkeys(status_key)
     progress_keys = [f for f in all_fields if f.startswith("sub_stage_")]
     if progress_keys:
         await redis.hdel(status_key, *progress_keys)
+        _invalidate_status_cache(video_id)
 
     logger.debug(f"Cleared sub_stage for {video_id}")
 
@@ -290,6 +316,7 @@ async def update_pipeline_status(video_id: str, status: str) -> None:
         updates["completed_at"] = str(time.time())
     
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
     logger.info(f"Updated pipeline status to {status} for {video_id}")
 
 
@@ -304,6 +331,7 @@ async def update_current_stage(video_id: str, stage: PipelineStage) -> None:
     redis = await get_async_redis_client()
     status_key = _get_status_key(video_id)
     await redis.hset(status_key, "current_stage", stage.value)
+    _invalidate_status_cache(video_id)
 
 
 async def get_current_stage(video_id: str) -> Optional[str]:
@@ -341,6 +369,7 @@ async def update_refinement_progress(video_id: str, total: int, processed: int,
     if successful is not None:
         mapping["refinement_successful"] = str(successful)
     await redis.hset(status_key, mapping=mapping)
+    _invalidate_status_cache(video_id)
 
 
 async def update_clip_extraction_progress(video_id: str, total: int, processed: int, failed: int = 0) -> None:
@@ -361,6 +390,7 @@ async def update_clip_extraction_progress(video_id: str, total: int, processed:
         "clips_failed": str(failed),
     }
     await redis.hset(status_key, mapping=mapping)
+    _invalidate_status_cache(video_id)
 
 
 async def get_status(video_id: str) -> Optional[Dict[str, Any]]:
@@ -394,12 +424,16 @@ async def delete_status(video_id: str) -> None:
     redis = await get_async_redis_client()
     status_key = _get_status_key(video_id)
     await redis.delete(status_key)
+    _invalidate_status_cache(video_id)
     logger.info(f"Deleted pipeline status for {video_id}")
 
 
 async def get_active_status(video_id: str) -> Optional[Dict[str, Any]]:
     """
-    Get active pipeline status (alias for get_status for clarity).
+    Get active pipeline status for the polled status endpoint.
+
+    Same data as get_status(), served from a 500ms in-process cache so that
+    concurrent polls for the same video share one Redis round-trip.
     
     Args:
         video_id: Video identifier
@@ -407,7 +441,17 @@ async def get_active_status(video_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Status dictionary or None if not found
     """
-    return await get_status(video_id)
+    now = time.monotonic()
+    cached = _active_status_cache.get(video_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    status_data = await get_status(video_id)
+
+    if len(_active_status_cache) >= _ACTIVE_STATUS_CACHE_MAX:
+        _active_status_cache.clear()
+    _active_status_cache[video_id] = (now + _ACTIVE_STATUS_CACHE_TTL, status_data)
+    return status_data
 
 
 async def get_stage_status(video_id: str, stage: PipelineStage) -> Optional[StageStatus]:
@@ -450,10 +494,11 @@ async def get_stage_error(video_id: str, stage: PipelineStage) -> Optional[str]:
     redis = await get_async_redis_client()
     status_key = _get_status_key(video_id)
     
-    # Check if this is the error stage
-    error_stage = await redis.hget(status_key, "error_stage")
+    # Fetch only the two error fields in a single round trip
+    error_stage, error_message = await redis.hmget(
+        status_key, "error_stage", "error_message"
+    )
     if error_stage == stage.value:
-        error_message = await redis.hget(status_key, "error_message")
         return error_message if error_message else None
     
     return None
@@ -477,6 +522,7 @@ async def set_stage_error(video_id: str, stage: PipelineStage, error: str) -> No
     }
     
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
     logger.error(f"Set error on stage {stage.value} for {video_id}: {error}")
 
 
@@ -520,8 +566,8 @@ async def cleanup_orphaned_status(video_id: str) -> None:
     redis = await get_async_redis_client()
     status_key = _get_status_key(video_id)
 
-    status_data = await redis.hgetall(status_key)
-    if not status_data:
+    # Only existence matters here; don't pull the whole hash over the wire
+    if not await redis.exists(status_key):
         logger.debug(f"No orphaned status to clean up for {video_id}")
         return
 
@@ -532,6 +578,7 @@ async def cleanup_orphaned_status(video_id: str) -> None:
         "error_message": "Worker process died unexpectedly. Job will be re-processed.",
     }
     await redis.hset(status_key, mapping=updates)
+    _invalidate_status_cache(video_id)
     # Remove TTL so this failed state remains visible briefly for history archival.
     # The worker will archive and delete it before re-acquiring the lock.
     logger.warning(f"Marked orphaned status as failed for {video_id}")
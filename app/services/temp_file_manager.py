@@ -16,7 +16,9 @@ by default, deleting files older than 24 hours). They can also be cleaned up
 immediately when a video is deleted via cleanup_video().
 """
 import logging
+import os
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -26,12 +28,15 @@ logger = logging.getLogger(__name__)
 VALID_PURPOSES = {"videos", "audio", "clips", "thumbnails"}
 
 
+@lru_cache(maxsize=1)
 def _get_temp_base() -> Path:
     """
     Return the absolute path to the temp base directory.
 
     Resolves temp_base_dir from settings relative to the backend root
-    (the directory containing the `app/` package).
+    (the directory containing the `app/` package). Resolved and created once
+    per process; get_temp_dir() recreates it via mkdir(parents=True) if it is
+    removed at runtime.
     """
     from app.core.config import get_settings
     settings = get_settings()
@@ -60,6 +65,25 @@ def get_temp_dir(purpose: str, identifier: str) -> Path:
     return target
 
 
+def get_purpose_dir(purpose: str) -> Path:
+    """
+    Return the temp directory for a purpose without creating it.
+
+    For read-only scans across all videos of one purpose; the directory may
+    not exist yet.
+
+    Args:
+        purpose: One of "videos", "audio", "clips", "thumbnails"
+
+    Returns:
+        Absolute Path to temp/{purpose}/
+    """
+    if purpose not in VALID_PURPOSES:
+        raise ValueError(f"Invalid temp purpose '{purpose}'. Must be one of: {VALID_PURPOSES}")
+
+    return _get_temp_base() / purpose
+
+
 def get_temp_file_path(purpose: str, identifier: str, filename: str) -> Path:
     """
     Return the full path for a temp file, creating parent directories.
@@ -105,31 +129,28 @@ async def cleanup_old_files(max_age_hours: float = 24.0) -> dict:
 
     cutoff = time.time() - (max_age_hours * 3600)
 
-    # First pass: delete old files
-    for file_path in base.rglob("*"):
-        if not file_path.is_file():
-            continue
-        try:
-            stat = file_path.stat()
-            if stat.st_mtime < cutoff:
-                size = stat.st_size
-                file_path.unlink()
-                files_deleted += 1
-                bytes_freed += size
-                logger.debug(f"Deleted old temp file: {file_path} (age={(time.time() - stat.st_mtime) / 3600:.1f}h)")
-        except FileNotFoundError:
-            pass  # Already deleted by a concurrent cleanup
-        except Exception as e:
-            logger.warning(f"Could not delete temp file {file_path}: {e}")
-
-    # Second pass: remove empty directories (bottom-up)
-    for dir_path in sorted(base.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-        if not dir_path.is_dir():
-            continue
-        if dir_path == base:
+    # Single bottom-up walk (os.walk is scandir-based): delete old files in a
+    # directory, then try to remove the directory once its children are done
+    for dir_path, _, filenames in os.walk(base, topdown=False):
+        for name in filenames:
+            file_path = os.path.join(dir_path, name)
+            try:
+                stat = os.stat(file_path, follow_symlinks=False)
+                if stat.st_mtime < cutoff:
+                    size = stat.st_size
+                    os.unlink(file_path)
+                    files_deleted += 1
+                    bytes_freed += size
+                    logger.debug(f"Deleted old temp file: {file_path} (age={(time.time() - stat.st_mtime) / 3600:.1f}h)")
+            except FileNotFoundError:
+                pass  # Already deleted by a concurrent cleanup
+            except Exception as e:
+                logger.warning(f"Could not delete temp file {file_path}: {e}")
+
+        if dir_path == str(base):
             continue
         try:
-            dir_path.rmdir()  # Only succeeds if empty
+            os.rmdir(dir_path)  # Only succeeds if empty
             dirs_removed += 1
             logger.debug(f"Removed empty temp dir: {dir_path}")
         except OSError:
@@ -176,26 +197,24 @@ async def cleanup_all() -> dict:
             "duration_ms": 0,
         }
 
-    # Delete all files
-    for file_path in base.rglob("*"):
-        if not file_path.is_file():
-            continue
-        try:
-            size = file_path.stat().st_size
-            file_path.unlink()
-            files_deleted += 1
-            bytes_freed += size
-        except FileNotFoundError:
-            pass
-        except Exception as e:
-            logger.warning(f"Could not delete temp file {file_path}: {e}")
+    # Delete all files and empty directories in one bottom-up walk
+    for dir_path, _, filenames in os.walk(base, topdown=False):
+        for name in filenames:
+            file_path = os.path.join(dir_path, name)
+            try:
+                size = os.stat(file_path, follow_symlinks=False).st_size
+                os.unlink(file_path)
+                files_deleted += 1
+                bytes_freed += size
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not delete temp file {file_path}: {e}")
 
-    # Remove empty directories bottom-up
-    for dir_path in sorted(base.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-        if not dir_path.is_dir() or dir_path == base:
+        if dir_path == str(base):
             continue
         try:
-            dir_path.rmdir()
+            os.rmdir(dir_path)
             dirs_removed += 1
         except OSError:
             pass
@@ -235,18 +254,23 @@ async def cleanup_video(identifier: str) -> dict:
     for purpose in VALID_PURPOSES:
         try:
             dir_path = _get_temp_base() / purpose / identifier
-            if not dir_path.exists():
+            try:
+                entries = os.scandir(dir_path)
+            except FileNotFoundError:
                 continue
 
-            for file_path in dir_path.iterdir():
-                if file_path.is_file():
-                    try:
-                        size = file_path.stat().st_size
-                        file_path.unlink()
-                        files_deleted += 1
-                        bytes_freed += size
-                    except Exception as e:
-                        logger.warning(f"Could not delete {file_path}: {e}")
+            # DirEntry.is_file()/stat() reuse the readdir result where the
+            # platform provides it, instead of one Path.stat() per file
+            with entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                            os.unlink(entry.path)
+                            files_deleted += 1
+                            bytes_freed += size
+                        except Exception as e:
+                            logger.warning(f"Could not delete {entry.path}: {e}")
 
             try:
                 dir_path.rmdir()
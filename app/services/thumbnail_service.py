@@ -20,7 +20,7 @@ import cv2
 import logging
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -126,6 +126,89 @@ def extract_frame_from_video(
 # Async thumbnail URL (DB-backed)
 # ---------------------------------------------------------------------------
 
+# Cached signed URLs are reused until this long before they expire
+_SIGNED_URL_REFRESH_BUFFER = timedelta(hours=1)
+
+
+def _cached_thumbnail_url_data(
+    video_identifier: str,
+    thumbnail,
+    fresh_until: datetime,
+) -> Optional[Dict[str, Any]]:
+    """URL data from the row's DB-cached signed URL, or None if it must be refreshed."""
+    if (
+        thumbnail.signed_url
+        and thumbnail.signed_url_expires_at
+        and thumbnail.signed_url_expires_at > fresh_until
+    ):
+        return {
+            "thumbnail_url": f"/api/videos/{video_identifier}/thumbnail",
+            "thumbnail_signed_url": thumbnail.signed_url,
+            "thumbnail_url_expires_at": thumbnail.signed_url_expires_at.isoformat() + "Z",
+        }
+    return None
+
+
+async def _refreshed_thumbnail_url_data(
+    session: AsyncSession,
+    video_identifier: str,
+    thumbnail,
+    signed_url: Optional[str],
+    expires_at: datetime,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    URL data for a freshly signed URL, staging the DB cache update on the session.
+
+    Returns:
+        Tuple of (url data dict, True if the session needs a commit)
+    """
+    from app.repositories import thumbnail_db_repository
+
+    api_url = f"/api/videos/{video_identifier}/thumbnail"
+    if not signed_url:
+        return {
+            "thumbnail_url": api_url,
+            "thumbnail_signed_url": None,
+            "thumbnail_url_expires_at": None,
+        }, False
+
+    await thumbnail_db_repository.update_signed_url(session, thumbnail.id, signed_url, expires_at)
+
+    return {
+        "thumbnail_url": api_url,
+        "thumbnail_signed_url": signed_url,
+        "thumbnail_url_expires_at": expires_at.isoformat() + "Z",
+    }, True
+
+
+async def _thumbnail_url_data(
+    session: AsyncSession,
+    video_identifier: str,
+    thumbnail,
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Build the thumbnail URL dict for an already-loaded Thumbnail row.
+
+    Reuses the DB-cached signed URL while it is valid (with a 1-hour buffer),
+    otherwise signs a fresh one and stages the update on the session.
+
+    Returns:
+        Tuple of (url data dict, True if the session needs a commit)
+    """
+    now = datetime.utcnow()
+    cached = _cached_thumbnail_url_data(video_identifier, thumbnail, now + _SIGNED_URL_REFRESH_BUFFER)
+    if cached is not None:
+        return cached, False
+
+    # Cache miss or near-expiry — generate a fresh signed URL and store it
+    from app.services.pipeline.upload_service import get_uploader
+    from app.core.config import get_settings
+
+    signed_url = await get_uploader().get_thumbnail_signed_url_async(thumbnail.cloud_url)
+    expires_at = now + timedelta(hours=get_settings().gcs_signed_url_expiry_hours)
+    return await _refreshed_thumbnail_url_data(session, video_identifier, thumbnail, signed_url, expires_at)
+
+
 async def get_thumbnail_url_async(
     video_identifier: str,
     session: AsyncSession,
@@ -150,46 +233,67 @@ async def get_thumbnail_url_async(
     if not thumbnail:
         return None
 
-    api_url = f"/api/videos/{video_identifier}/thumbnail"
-    buffer = timedelta(hours=1)
+    data, needs_commit = await _thumbnail_url_data(session, video_identifier, thumbnail)
+    if needs_commit:
+        await session.commit()
+    return data
+
+
+async def thumbnail_urls_from_rows(
+    thumbnails: Dict[str, Any],
+    session: AsyncSession,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build thumbnail URL data for already-loaded Thumbnail rows.
+
+    Commits refreshed signed URLs once at the end instead of once per video.
+
+    Args:
+        thumbnails: Thumbnail rows keyed by video identifier
+        session: Session the rows were loaded with
+
+    Returns:
+        Dict of URL data keyed by video identifier
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    stale: Dict[str, Any] = {}
+
+    # Expiry threshold is computed once for the whole batch; rows with a
+    # valid cached URL are answered without any awaits
     now = datetime.utcnow()
+    fresh_until = now + _SIGNED_URL_REFRESH_BUFFER
+    for video_identifier, thumbnail in thumbnails.items():
+        cached = _cached_thumbnail_url_data(video_identifier, thumbnail, fresh_until)
+        if cached is None:
+            stale[video_identifier] = thumbnail
+        else:
+            results[video_identifier] = cached
 
-    # Return cached signed URL if it is still valid (with buffer)
-    if (
-        thumbnail.signed_url
-        and thumbnail.signed_url_expires_at
-        and thumbnail.signed_url_expires_at > now + buffer
-    ):
-        return {
-            "thumbnail_url": api_url,
-            "thumbnail_signed_url": thumbnail.signed_url,
-            "thumbnail_url_expires_at": thumbnail.signed_url_expires_at.isoformat() + "Z",
-        }
+    if not stale:
+        return results
 
-    # Cache miss or near-expiry — generate a fresh signed URL and store it
-    from app.services.pipeline.upload_service import GCSUploader
+    from app.services.pipeline.upload_service import get_uploader
     from app.core.config import get_settings
 
-    uploader = GCSUploader()
-    signed_url = uploader.get_thumbnail_signed_url(thumbnail.cloud_url)
-    if not signed_url:
-        return {
-            "thumbnail_url": api_url,
-            "thumbnail_signed_url": None,
-            "thumbnail_url_expires_at": None,
-        }
-
-    settings = get_settings()
-    expires_at = now + timedelta(hours=settings.gcs_signed_url_expiry_hours)
+    # Sign the stale ones concurrently (each is a thread-pool call); the DB
+    # updates are then staged serially since the session is not concurrent-safe
+    uploader = get_uploader()
+    signed_urls = await asyncio.gather(
+        *(uploader.get_thumbnail_signed_url_async(thumbnail.cloud_url) for thumbnail in stale.values())
+    )
+    expires_at = now + timedelta(hours=get_settings().gcs_signed_url_expiry_hours)
 
-    await thumbnail_db_repository.update_signed_url(session, thumbnail.id, signed_url, expires_at)
-    await session.commit()
+    needs_commit = False
+    for (video_identifier, thumbnail), signed_url in zip(stale.items(), signed_urls):
+        data, refreshed = await _refreshed_thumbnail_url_data(
+            session, video_identifier, thumbnail, signed_url, expires_at
+        )
+        results[video_identifier] = data
+        needs_commit = needs_commit or refreshed
 
-    return {
-        "thumbnail_url": api_url,
-        "thumbnail_signed_url": signed_url,
-        "thumbnail_url_expires_at": expires_at.isoformat() + "Z",
-    }
+    if needs_commit:
+        await session.commit()
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -224,14 +328,14 @@ async def generate_thumbnail_async(
         Returns None if the video is not found in the database.
     """
     from app.repositories import thumbnail_db_repository, video_db_repository
-    from app.services.pipeline.upload_service import GCSUploader
+    from app.services.pipeline.upload_service import get_uploader
     from app.utils.video import ensure_local_video_async
 
     # Step 1: Check if thumbnail already exists
     existing = await thumbnail_db_repository.get_by_video_identifier(session, video_identifier)
     if existing:
         logger.info(f"Thumbnail already exists in DB for video: {video_identifier}")
-        uploader = GCSUploader()
+        uploader = get_uploader()
         signed_url = uploader.get_thumbnail_signed_url(existing.cloud_url)
         if signed_url:
             from app.core.config import get_settings
@@ -278,7 +382,7 @@ async def generate_thumbnail_async(
         file_size_bytes = os.path.getsize(temp_thumbnail_path)
         file_size_kb = file_size_bytes // 1024
 
-        uploader = GCSUploader()
+        uploader = get_uploader()
         gcs_path, signed_url = await uploader.upload_thumbnail(
             temp_thumbnail_path, "video", video_identifier
         )
@@ -299,6 +403,9 @@ async def generate_thumbnail_async(
         await thumbnail_db_repository.update_signed_url(session, thumbnail.id, signed_url, expires_at)
         await session.commit()
 
+        from app.services.video_response_cache import invalidate_video_responses
+        await invalidate_video_responses(video_identifier)
+
         logger.info(
             f"Thumbnail generated and uploaded for {video_identifier}: "
             f"gcs_path={gcs_path}, size={file_size_kb}KB"
@@ -1,7 +1,10 @@
 import asyncio
 import json
+import os
+import struct
 import subprocess
 import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, List
 import logging
@@ -90,10 +93,10 @@ async def delete_all_clips_for_video(video_id: str) -> int:
     """
     from app.database.session import get_session_factory
     from app.repositories import video_db_repository, clip_db_repository
-    from app.services.pipeline.upload_service import GCSUploader
+    from app.services.pipeline.upload_service import get_uploader
 
     try:
-        uploader = GCSUploader()
+        uploader = get_uploader()
         deleted_gcs = await uploader.delete_clips_for_video(video_id)
         logger.info(f"Deleted {deleted_gcs} GCS clips for {video_id}")
     except Exception as e:
@@ -123,7 +126,7 @@ async def get_clip_signed_url(moment_identifier: str) -> Optional[str]:
     """
     from app.database.session import get_session_factory
     from app.repositories import clip_db_repository
-    from app.services.pipeline.upload_service import GCSUploader
+    from app.services.pipeline.upload_service import get_uploader
 
     session_factory = get_session_factory()
     async with session_factory() as session:
@@ -131,8 +134,8 @@ async def get_clip_signed_url(moment_identifier: str) -> Optional[str]:
         if not clip:
             return None
 
-    uploader = GCSUploader()
-    return uploader.generate_signed_url(clip.cloud_url)
+    uploader = get_uploader()
+    return await uploader.generate_signed_url_async(clip.cloud_url)
 
 
 async def get_clip_gcs_signed_url_async(moment_id: str, video_filename: str) -> Optional[str]:
@@ -208,17 +211,95 @@ def _extract_clip_metadata(clip_path: Path) -> Dict:
     return metadata
 
 
+# ISO BMFF containers whose duration can be read straight from the moov/mvhd atom
+_MP4_SUFFIXES = {".mp4", ".m4v", ".mov"}
+
+
+def _read_mp4_duration(video_path: str) -> Optional[float]:
+    """
+    Read the movie duration from an MP4/MOV file's mvhd atom.
+
+    Walks the top-level atoms to moov, then moov's children to mvhd, seeking
+    over everything else (including mdat), so only a few hundred bytes of
+    headers are read regardless of file size.
+
+    Returns:
+        Duration in seconds, or None if the header is missing, malformed or
+        carries no duration (e.g. fragmented MP4)
+    """
+    with open(video_path, "rb") as f:
+        end = os.fstat(f.fileno()).st_size
+        pos = 0
+        while pos + 8 <= end:
+            f.seek(pos)
+            size, kind = struct.unpack(">I4s", f.read(8))
+            header_len = 8
+            if size == 1:
+                size = struct.unpack(">Q", f.read(8))[0]
+                header_len = 16
+            elif size == 0:
+                size = end - pos
+            if size < header_len:
+                return None
+
+            if kind == b"moov":
+                # Descend: continue scanning moov's children only
+                end = pos + size
+                pos += header_len
+                continue
+
+            if kind == b"mvhd":
+                version = f.read(4)[0]
+                if version == 1:
+                    _, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+                    unknown = 0xFFFFFFFFFFFFFFFF
+                else:
+                    _, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+                    unknown = 0xFFFFFFFF
+                if not timescale or not duration or duration == unknown:
+                    return None
+                return duration / timescale
+
+            pos += size
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _probe_video_duration(video_path: str, mtime_ns: int, size: int) -> float:
+    """
+    Duration probe behind get_video_duration(), cached per file version.
+
+    mtime_ns and size are part of the cache key only, so a file replaced
+    in place is probed again.
+    """
+    if Path(video_path).suffix.lower() in _MP4_SUFFIXES:
+        try:
+            duration = _read_mp4_duration(video_path)
+            if duration is not None:
+                return duration
+        except (OSError, struct.error, IndexError) as e:
+            logger.debug(f"MP4 header parse failed for {video_path}, falling back to OpenCV: {e}")
+
+    cap = cv2.VideoCapture(video_path)
+    if not cap.isOpened():
+        return 0.0
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+    duration = frame_count / fps if fps > 0 else 0.0
+    cap.release()
+    return duration
+
+
 def get_video_duration(video_path: Path) -> float:
-    """Get video duration in seconds using OpenCV."""
+    """
+    Get video duration in seconds.
+
+    MP4/MOV durations come from the container header; other formats (or
+    headers without a duration) fall back to OpenCV.
+    """
     try:
-        cap = cv2.VideoCapture(str(video_path))
-        if not cap.isOpened():
-            return 0.0
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
-        duration = frame_count / fps if fps > 0 else 0.0
-        cap.release()
-        return duration
+        stat = os.stat(video_path)
+        return _probe_video_duration(str(video_path), stat.st_mtime_ns, stat.st_size)
     except Exception as e:
         logger.error(f"Error getting video duration: {e}")
         return 0.0
@@ -239,22 +320,20 @@ def get_clip_duration(moment_id: str, video_filename: str) -> Optional[float]:
     """
     clip_path = get_clip_path(moment_id, video_filename)
 
-    if not clip_path.exists() or not clip_path.is_file():
+    try:
+        stat = clip_path.stat()
+    except FileNotFoundError:
         logger.debug(f"Clip file not found: {clip_path}")
         return None
 
     try:
-        cap = cv2.VideoCapture(str(clip_path))
-        if not cap.isOpened():
-            logger.error(f"Could not open clip file: {clip_path}")
+        # Same header-first, per-file-version cached probe as get_video_duration()
+        duration = _probe_video_duration(str(clip_path), stat.st_mtime_ns, stat.st_size)
+        if duration <= 0:
+            logger.error(f"Could not determine duration of clip file: {clip_path}")
             return None
 
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
-        duration = frame_count / fps if fps > 0 else 0.0
-        cap.release()
-
-        logger.debug(f"Clip duration for {moment_id}: {duration:.2f}s (fps={fps}, frames={frame_count})")
+        logger.debug(f"Clip duration for {moment_id}: {duration:.2f}s")
         return duration
     except Exception as e:
         logger.error(f"Error getting clip duration for {moment_id}: {e}")
@@ -458,8 +537,8 @@ async def _process_single_clip(
         metadata = await asyncio.to_thread(_extract_clip_metadata, output_path)
 
         # --- Step 5: Upload to GCS (async, main loop) ---
-        from app.services.pipeline.upload_service import GCSUploader
-        uploader = GCSUploader()
+        from app.services.pipeline.upload_service import get_uploader
+        uploader = get_uploader()
         gcs_path, _ = await uploader.upload_clip(output_path, video_id, moment_id)
 
         # --- Step 6: Insert DB record (async, main loop) ---
@@ -528,6 +607,7 @@ async def extract_clips_parallel(
     progress_callback: Optional[callable] = None,
     cloud_url: Optional[str] = None,
     sub_stage_callback: Optional[callable] = None,
+    video_duration: Optional[float] = None,
 ) -> bool:
     """
     Extract clips for all original moments in a video using async concurrency.
@@ -547,6 +627,9 @@ async def extract_clips_parallel(
         sub_stage_callback: Optional async callback invoked after video download
                             completes (if a download was needed) so the caller
                             can advance the sub_stage label in Redis.
+        video_duration: Known duration in seconds (e.g. videos.duration_seconds
+                        from ffprobe at download time); probed from the file
+                        when missing
 
     Returns:
         True if successful (at least one clip created or all skipped), False otherwise
@@ -597,8 +680,9 @@ async def extract_clips_parallel(
         else:
             logger.warning(f"Transcript not available for {audio_filename}, using simple padding")
 
-        # --- Get video duration ---
-        video_duration = await asyncio.to_thread(get_video_duration, video_path)
+        # --- Get video duration (stored value first, file probe as fallback) ---
+        if not video_duration or video_duration <= 0:
+            video_duration = await asyncio.to_thread(get_video_duration, video_path)
         if video_duration <= 0:
             raise ValueError(f"Could not determine video duration for {video_filename}")
 
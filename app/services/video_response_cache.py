@@ -0,0 +1,88 @@
+"""
+Short-lived Redis cache for the video listing and metadata responses.
+
+GET /api/videos and GET /api/videos/{id} rebuild the same payload on every
+hit (DB rows, thumbnail signed URLs, audio/transcript checks) although the
+underlying data only changes when a pipeline stage finishes, a thumbnail is
+generated or a video is deleted. Responses are cached for a short TTL and
+explicitly invalidated from those write paths.
+
+Payloads are stored as the exact JSON body the endpoint sends, so a hit is
+returned as-is without decoding and re-encoding. Signed URLs in the payload
+stay valid for hours, so the TTL here never serves an expired URL. Redis
+failures are logged and treated as a miss.
+"""
+import logging
+from typing import Any, Optional
+
+import orjson
+
+from app.core.redis import get_async_redis_client
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "videos:response:"
+LIST_KEY = f"{KEY_PREFIX}list"
+CACHE_TTL_SECONDS = 60
+
+
+def video_key(video_id: str) -> str:
+    """Get Redis key for a single video's cached metadata response."""
+    return f"{KEY_PREFIX}video:{video_id}"
+
+
+async def get_cached_response(key: str) -> Optional[str]:
+    """
+    Return the cached JSON body for key, or None on miss or Redis error.
+
+    Args:
+        key: Cache key (LIST_KEY or video_key(...))
+    """
+    try:
+        redis = await get_async_redis_client()
+        return await redis.get(key)
+    except Exception as e:
+        logger.warning(f"Video response cache read failed for {key}: {e}")
+        return None
+
+
+async def set_cached_response(key: str, payload: Any) -> bytes:
+    """
+    Serialize a payload to JSON and store it under key with the cache TTL.
+
+    The payload is encoded once; the same bytes are cached and returned so
+    the caller can send them as the response body.
+
+    Args:
+        key: Cache key (LIST_KEY or video_key(...))
+        payload: Response payload (dicts/lists of plain values)
+
+    Returns:
+        JSON-encoded payload, returned even if the cache write fails
+    """
+    body = orjson.dumps(payload, default=str)
+    try:
+        redis = await get_async_redis_client()
+        await redis.set(key, body, ex=CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning(f"Video response cache write failed for {key}: {e}")
+    return body
+
+
+async def invalidate_video_responses(video_id: Optional[str] = None) -> None:
+    """
+    Drop the cached video list and, if given, the cached entry for one video.
+
+    Called from write paths that change what the video endpoints return.
+
+    Args:
+        video_id: Video identifier whose metadata entry should be dropped
+    """
+    keys = [LIST_KEY]
+    if video_id:
+        keys.append(video_key(video_id))
+    try:
+        redis = await get_async_redis_client()
+        await redis.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Video response cache invalidation failed for {video_id}: {e}")
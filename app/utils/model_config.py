@@ -130,11 +130,13 @@ async def model_supports_video(model_key: str) -> bool:
     Returns:
         True if model supports video, False otherwise
     """
+    from app.services.config_registry import get_config_registry
+
     try:
-        config = await get_model_config(model_key)
-        return config.get('supports_video', False)
+        # One HGET instead of loading and deserializing the whole config
+        registry = get_config_registry()
+        return bool(await registry.get_config_field(model_key, 'supports_video'))
     except Exception:
-        # Handle both ValueError (old) and ModelConfigNotFoundError (new)
         return False
 
 
@@ -59,9 +59,9 @@ def ensure_local_video(identifier: str, cloud_url: str) -> Path:
 
     async def download_video():
         """Async helper to download video from GCS."""
-        from app.services.gcs_downloader import GCSDownloader
+        from app.services.gcs_downloader import get_downloader
 
-        downloader = GCSDownloader()
+        downloader = get_downloader()
         success = await downloader.download(
             url=cloud_url,
             dest_path=temp_path,
@@ -120,9 +120,9 @@ async def ensure_local_video_async(
 
     # Priority 2: Download from GCS to temp directory (async, no asyncio.run())
     logger.info(f"Video not found locally, downloading from GCS: {cloud_url}")
-    from app.services.gcs_downloader import GCSDownloader
+    from app.services.gcs_downloader import get_downloader
 
-    downloader = GCSDownloader()
+    downloader = get_downloader()
     success = await downloader.download(
         url=cloud_url,
         dest_path=temp_path,